@@ -0,0 +1,104 @@
+"""On-disk cache of lexer and parser results for TaskLang Compiler."""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .lexer.token import Token
+from .parser.ast import ProgramNode
+
+
+# Bump whenever the Token or AST layout changes so old entries are ignored
+VERSION = "5"
+
+# Directory holding one pickle per cached source
+cache_dir = Path.home() / ".tasklang_cache"
+
+# Most pickles kept in cache_dir; the least recently used are pruned on store
+MAX_ENTRIES = 64
+
+
+def cache_key(source: str) -> str:
+    """
+    Compute the cache key for a source text.
+
+    Args:
+        source: TaskLang source code
+
+    Returns:
+        Hex digest identifying the source and cache format version
+    """
+    return hashlib.sha256((VERSION + source).encode('utf-8')).hexdigest()
+
+
+def load(source: str) -> Optional[Tuple[List[Token], ProgramNode]]:
+    """
+    Look up the cached tokens and AST for a source text.
+
+    Args:
+        source: TaskLang source code
+
+    Returns:
+        Tuple of (tokens, ast), or None on a cache miss
+    """
+    path = cache_dir / f"{cache_key(source)}.pkl"
+    try:
+        with open(path, 'rb') as f:
+            entry = pickle.load(f)
+    except Exception:
+        # Missing, unreadable, or stale entries are all treated as a miss
+        return None
+
+    # Mark the entry as recently used so pruning keeps it
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return entry
+
+
+def store(source: str, tokens: List[Token], ast: ProgramNode):
+    """
+    Save the tokens and AST for a source text.
+
+    Only sources that passed semantic analysis should be stored, since a
+    cache hit skips every front-end stage. Once more than MAX_ENTRIES
+    pickles exist, the least recently used ones are deleted.
+
+    Args:
+        source: TaskLang source code
+        tokens: Tokens produced by the lexer
+        ast: ProgramNode produced by the parser
+    """
+    path = cache_dir / f"{cache_key(source)}.pkl"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump((tokens, ast), f, protocol=pickle.HIGHEST_PROTOCOL)
+        _prune()
+    except OSError:
+        # Caching is best-effort
+        pass
+
+
+def _prune():
+    """Delete the least recently used pickles beyond MAX_ENTRIES."""
+    entries = []
+    for path in cache_dir.glob("*.pkl"):
+        try:
+            entries.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            # Removed by another process since the listing
+            continue
+
+    if len(entries) <= MAX_ENTRIES:
+        return
+
+    entries.sort(reverse=True)
+    for _, path in entries[MAX_ENTRIES:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
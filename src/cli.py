@@ -1,12 +1,29 @@
 """Command-line interface for TaskLang Compiler."""
 
+import os
 import sys
 import argparse
+import hashlib
+import itertools
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List
 from .lexer.lexer import Lexer, LexerError
 from .parser.parser import Parser, ParserError
 from .semantic.analyzer import SemanticAnalyzer, SemanticError
 from .codegen.python_gen import PythonCodeGenerator
+from . import cache
+
+
+# Bump when code generation changes so stale cached outputs are not reused
+CACHE_VERSION = "1"
+
+# Size in bytes of the source hash used to key cached outputs
+_CACHE_DIGEST_SIZE = 16
+
+# Subdirectory of cache.cache_dir holding cached generated scripts
+_OUTPUT_CACHE_SUBDIR = "cli"
 
 
 class TaskLangCLI:
@@ -29,9 +46,10 @@ class TaskLangCLI:
         )
         
         parser.add_argument(
-            'input_file',
+            'input_files',
             type=str,
-            help='Input .task file to compile'
+            nargs='+',
+            help='Input .task file(s) to compile'
         )
         
         parser.add_argument(
@@ -41,110 +59,194 @@ class TaskLangCLI:
             help='Output directory for generated Python file (default: output/)'
         )
         
+        parser.add_argument(
+            '--verbose', '-v',
+            action='store_true',
+            help='Print the token stream and AST during compilation'
+        )
+        
         return parser
     
     def run(self):
         """
-        Execute the full compilation pipeline.
+        Compile every input file given on the command line.
         
-        This method orchestrates:
-        1. Reading the input file
-        2. Tokenization (Lexer)
-        3. Parsing (Parser)
-        4. Semantic analysis (SemanticAnalyzer)
-        5. Code generation (PythonCodeGenerator)
+        Exits with status 1 if any file failed to compile.
         """
         args = self.parser.parse_args()
+        statuses = compile_many(args.input_files, args.output, args.verbose)
         
-        # Validate and process input file
-        input_file = Path(args.input_file)
-        
-        # Validate file extension
-        if not input_file.suffix == '.task':
-            print(f"Error: File must have .task extension: {input_file}", file=sys.stderr)
+        if any(statuses):
             sys.exit(1)
+
+
+def compile_many(paths: List[str], out_dir: str, verbose: bool = False) -> List[int]:
+    """
+    Compile several .task files into the same output directory.
+    
+    A single file is compiled in-process; several files are compiled in
+    parallel worker processes, since each compilation is independent.
+    
+    Args:
+        paths: Paths to the input .task files
+        out_dir: Output directory for the generated Python files
+        verbose: Print the token stream and AST while compiling
         
-        # Check if file exists
-        if not input_file.exists():
-            print(f"Error: File not found: {input_file}", file=sys.stderr)
-            sys.exit(1)
+    Returns:
+        The compile_one status for each path, in order
+    """
+    if len(paths) == 1:
+        return [compile_one(paths[0], out_dir, verbose)]
+    
+    max_workers = min(len(paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            compile_one,
+            paths,
+            itertools.repeat(out_dir),
+            itertools.repeat(verbose)
+        ))
+
+
+def compile_one(path: str, out_dir: str, verbose: bool = False) -> int:
+    """
+    Execute the full compilation pipeline for a single file.
+    
+    This function orchestrates:
+    1. Reading the input file
+    2. Tokenization (Lexer)
+    3. Parsing (Parser)
+    4. Semantic analysis (SemanticAnalyzer)
+    5. Code generation (PythonCodeGenerator)
+    
+    Args:
+        path: Path to the input .task file
+        out_dir: Output directory for the generated Python file
+        verbose: Print the token stream and AST while compiling
         
-        # Read the file content
+    Returns:
+        0 on success, 1 if any stage failed
+    """
+    # Validate and process input file
+    input_file = Path(path)
+    
+    # Validate file extension
+    if not input_file.suffix == '.task':
+        print(f"Error: File must have .task extension: {input_file}", file=sys.stderr)
+        return 1
+    
+    # Check if file exists
+    if not input_file.exists():
+        print(f"Error: File not found: {input_file}", file=sys.stderr)
+        return 1
+    
+    # Read the file content
+    try:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            source = f.read()
+    except Exception as e:
+        print(f"Error: Failed to read file {input_file}: {e}", file=sys.stderr)
+        return 1
+    
+    # Reuse a previous compilation of identical source, if one is cached.
+    # Verbose runs always compile, since a cache hit has no tokens or AST to print.
+    input_filename = input_file.stem  # Get filename without extension
+    output_dir = Path(out_dir)
+    output_file = output_dir / f"{input_filename}.py"
+    cache_key = hashlib.blake2b(
+        (CACHE_VERSION + source).encode('utf-8'), digest_size=_CACHE_DIGEST_SIZE
+    ).hexdigest()
+    cache_file = cache.cache_dir / _OUTPUT_CACHE_SUBDIR / f"{input_filename}.{cache_key}.py"
+    
+    if not verbose and cache_file.exists():
         try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                source = f.read()
-        except Exception as e:
-            print(f"Error: Failed to read file {input_file}: {e}", file=sys.stderr)
-            sys.exit(1)
+            shutil.copyfile(cache_file, output_file)
+            print(f"✅ Python automation script generated at {output_file} (cached)")
+            return 0
+        except OSError:
+            # Fall through to a full compilation
+            pass
+    
+    # Step 1: Tokenize using Lexer
+    try:
+        lexer = Lexer(source)
+        tokens = lexer.tokenize()
         
-        # Step 1: Tokenize using Lexer
-        try:
-            lexer = Lexer(source)
-            tokens = lexer.tokenize()
+        if verbose:
+            sys.stdout.write("Tokens:\n" + "".join(f"{token}\n" for token in tokens) + "\n")
             
-            # Print all tokens
-            print("Tokens:")
-            for token in tokens:
-                print(token)
-            print()
-                
-        except LexerError as e:
-            print(f"Lexer Error: {e}", file=sys.stderr)
-            sys.exit(1)
-        except Exception as e:
-            print(f"Error: Unexpected error during lexing: {e}", file=sys.stderr)
-            sys.exit(1)
+    except LexerError as e:
+        print(f"Lexer Error: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error: Unexpected error during lexing: {e}", file=sys.stderr)
+        return 1
+    
+    # Step 2: Parse tokens to AST using Parser
+    try:
+        parser = Parser(tokens)
+        ast = parser.parse()
         
-        # Step 2: Parse tokens to AST using Parser
-        try:
-            parser = Parser(tokens)
-            ast = parser.parse()
-            
-            # Print AST
-            print("AST:")
-            print(ast)
-            print()
-            
-        except ParserError as e:
-            print(f"Parser Error: {e}", file=sys.stderr)
-            sys.exit(1)
-        except Exception as e:
-            print(f"Error: Unexpected error during parsing: {e}", file=sys.stderr)
-            sys.exit(1)
+        if verbose:
+            sys.stdout.write(f"AST:\n{ast}\n\n")
         
-        # Step 3: Perform semantic analysis using SemanticAnalyzer
-        try:
-            analyzer = SemanticAnalyzer(ast)
-            analyzer.analyze()
-            print("✅ Semantic Analysis Passed")
-            print()
-            
-        except SemanticError as e:
-            print(f"Semantic Error: {e}", file=sys.stderr)
-            sys.exit(1)
-        except Exception as e:
-            print(f"Error: Unexpected error during semantic analysis: {e}", file=sys.stderr)
-            sys.exit(1)
+    except ParserError as e:
+        print(f"Parser Error: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error: Unexpected error during parsing: {e}", file=sys.stderr)
+        return 1
+    
+    # Step 3: Perform semantic analysis using SemanticAnalyzer
+    try:
+        analyzer = SemanticAnalyzer(ast)
+        analyzer.analyze()
+        print("✅ Semantic Analysis Passed")
+        print()
         
-        # Step 4: Generate Python Selenium code using PythonCodeGenerator
-        try:
-            # Determine output filename
-            input_filename = input_file.stem  # Get filename without extension
-            output_dir = Path(args.output)
-            
-            # Ensure output directory exists
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Construct output file path
-            output_file = output_dir / f"{input_filename}.py"
-            
-            # Generate code
-            generator = PythonCodeGenerator(ast)
-            generator.generate(str(output_file))
-            
-            print(f"✅ Python automation script generated at {output_file}")
-            
-        except Exception as e:
-            print(f"Error: Failed to generate Python code: {e}", file=sys.stderr)
-            sys.exit(1)
+    except SemanticError as e:
+        print(f"Semantic Error: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error: Unexpected error during semantic analysis: {e}", file=sys.stderr)
+        return 1
+    
+    # Step 4: Generate Python Selenium code using PythonCodeGenerator
+    try:
+        # Generate code (the generator creates the output directory if needed)
+        generator = PythonCodeGenerator(ast)
+        generator.generate(str(output_file))
+        
+        print(f"✅ Python automation script generated at {output_file}")
+        
+    except Exception as e:
+        print(f"Error: Failed to generate Python code: {e}", file=sys.stderr)
+        return 1
+    
+    # Remember this output for the next compilation of the same source
+    _store_cached_output(output_file, cache_file)
+    return 0
 
+
+def _store_cached_output(output_file: Path, cache_file: Path):
+    """
+    Save a generated script under its source-hash cache path.
+    
+    Cached outputs live in their own directory under cache.cache_dir rather
+    than next to the generated scripts. Older cache entries for the same
+    script name are pruned, so at most one cached output is kept per script.
+    
+    Args:
+        output_file: The freshly generated Python file
+        cache_file: Cache path keyed by the source hash
+    """
+    pattern = f"{output_file.stem}.{'?' * (2 * _CACHE_DIGEST_SIZE)}.py"
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        for stale in cache_file.parent.glob(pattern):
+            if stale != cache_file:
+                stale.unlink()
+        shutil.copyfile(output_file, cache_file)
+    except OSError:
+        # Caching is best-effort; the compilation itself already succeeded
+        pass
@@ -1,5 +1,7 @@
 """Python code generator for TaskLang Compiler."""
 
+import functools
+import os
 from pathlib import Path
 from ..parser.ast import (
     ProgramNode, OpenNode, GoNode, TypeNode, EnterNode,
@@ -7,6 +9,113 @@ from ..parser.ast import (
 )
 
 
+def _encode_lines(*lines: str) -> bytes:
+    """Join newline-terminated source lines into a single UTF-8 block."""
+    return "".join(lines).encode('utf-8')
+
+
+# Fixed prefix of every generated script: imports followed by a blank line
+_HEADER = _encode_lines(
+    "from selenium import webdriver\n",
+    "from selenium.webdriver.chrome.options import Options as ChromeOptions\n",
+    "from selenium.webdriver.chrome.service import Service as ChromeService\n",
+    "from selenium.webdriver.firefox.options import Options as FirefoxOptions\n",
+    "from selenium.webdriver.edge.options import Options as EdgeOptions\n",
+    "from selenium.webdriver.common.by import By\n",
+    "from selenium.webdriver.common.keys import Keys\n",
+    "from selenium.webdriver.support.ui import WebDriverWait\n",
+    "from selenium.webdriver.support import expected_conditions as EC\n",
+    "import time\n",
+    "\n",
+)
+
+# Browser setup blocks emitted for 'open <browser>'
+_CHROME_OPEN_LINES = _encode_lines(
+    "# Configure Chrome options to avoid bot detection\n",
+    "chrome_options = ChromeOptions()\n",
+    "chrome_options.add_argument('--disable-blink-features=AutomationControlled')\n",
+    "chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])\n",
+    "chrome_options.add_experimental_option('useAutomationExtension', False)\n",
+    "chrome_options.add_argument('--disable-dev-shm-usage')\n",
+    "chrome_options.add_argument('--no-sandbox')\n",
+    "chrome_options.add_argument('--disable-gpu')\n",
+    "chrome_options.add_argument('--window-size=1920,1080')\n",
+    "chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')\n",
+    "driver = webdriver.Chrome(options=chrome_options)\n",
+    "# Execute script to remove webdriver property\n",
+    "driver.execute_script(\"Object.defineProperty(navigator, 'webdriver', {get: () => undefined})\")\n",
+)
+
+_FIREFOX_OPEN_LINES = _encode_lines(
+    "# Configure Firefox options\n",
+    "firefox_options = FirefoxOptions()\n",
+    "firefox_options.set_preference('dom.webdriver.enabled', False)\n",
+    "firefox_options.set_preference('useAutomationExtension', False)\n",
+    "driver = webdriver.Firefox(options=firefox_options)\n",
+)
+
+_EDGE_OPEN_LINES = _encode_lines(
+    "# Configure Edge options\n",
+    "edge_options = EdgeOptions()\n",
+    "edge_options.add_argument('--disable-blink-features=AutomationControlled')\n",
+    "edge_options.add_experimental_option('excludeSwitches', ['enable-automation'])\n",
+    "edge_options.add_experimental_option('useAutomationExtension', False)\n",
+    "driver = webdriver.Edge(options=edge_options)\n",
+)
+
+_SAFARI_OPEN_LINES = _encode_lines(
+    "driver = webdriver.Safari()\n",
+)
+
+# Fallback for unknown browsers: Chrome with anti-detection
+_DEFAULT_OPEN_LINES = _encode_lines(
+    "chrome_options = ChromeOptions()\n",
+    "chrome_options.add_argument('--disable-blink-features=AutomationControlled')\n",
+    "chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])\n",
+    "chrome_options.add_experimental_option('useAutomationExtension', False)\n",
+    "driver = webdriver.Chrome(options=chrome_options)\n",
+    "driver.execute_script(\"Object.defineProperty(navigator, 'webdriver', {get: () => undefined})\")\n",
+)
+
+_OPEN_LINES = {
+    'chrome': _CHROME_OPEN_LINES,
+    'firefox': _FIREFOX_OPEN_LINES,
+    'edge': _EDGE_OPEN_LINES,
+    'safari': _SAFARI_OPEN_LINES,
+}
+
+# Selenium locator strategy for each selector type
+_BY = {
+    'id': 'By.ID',
+    'name': 'By.NAME',
+    'xpath': 'By.XPATH',
+    'css': 'By.CSS_SELECTOR',
+    'tag': 'By.TAG_NAME',
+}
+
+# Translation table for escaping selector and text values in emitted string literals
+_ESCAPE_DQUOTE = str.maketrans({'"': '\\"'})
+
+# Escapes needed to embed an arbitrary string in a double-quoted Python literal
+_PY_LITERAL_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r'})
+
+# Output directories already created by this process
+_ensured_dirs: "set[str]" = set()
+
+
+def _ensure_dir(path: Path):
+    """Create ``path`` (and parents) unless this process already has."""
+    key = str(path)
+    if key not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(key)
+
+
+def _py_str_literal(s: str) -> str:
+    """Return ``s`` as a double-quoted Python string literal."""
+    return '"' + s.translate(_PY_LITERAL_TABLE) + '"'
+
+
 class PythonCodeGenerator:
     """Generates Python Selenium automation code from TaskLang AST."""
     
@@ -14,11 +123,14 @@ class PythonCodeGenerator:
         """
         Initialize the Python code generator with an AST.
         
+        Code is accumulated as UTF-8 bytes in ``self.buf``.
+        
         Args:
             ast: The ProgramNode root of the AST to generate code from
         """
         self.ast = ast
-        self.lines = []
+        self.buf = bytearray()
+        self._emit = self.buf.extend
     
     def generate(self, output_path: str) -> str:
         """
@@ -30,41 +142,38 @@ class PythonCodeGenerator:
         Returns:
             The generated Python code as a string
         """
-        self.lines = []
-        
-        # Add imports
-        self._add_imports()
-        self.lines.append("")
-        
-        # Generate code for each statement
-        for statement in self.ast.statements:
-            self._generate_statement(statement)
-        
-        # Join all lines
-        code = "\n".join(self.lines)
+        self._emit_program()
         
         # Ensure output directory exists
         output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(output_file.parent)
         
-        # Write to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(code)
+        # Write to file with raw os.write calls (looping in case of short writes)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        try:
+            fd = os.open(str(output_file), flags, 0o644)
+        except FileNotFoundError:
+            # The directory was removed since it was first created
+            _ensured_dirs.discard(str(output_file.parent))
+            _ensure_dir(output_file.parent)
+            fd = os.open(str(output_file), flags, 0o644)
+        try:
+            written = 0
+            while written < len(self.buf):
+                written += os.write(fd, memoryview(self.buf)[written:])
+        finally:
+            os.close(fd)
         
-        return code
+        return self.buf.decode('utf-8')
     
-    def _add_imports(self):
-        """Add required imports at the top of the file."""
-        self.lines.append("from selenium import webdriver")
-        self.lines.append("from selenium.webdriver.chrome.options import Options as ChromeOptions")
-        self.lines.append("from selenium.webdriver.chrome.service import Service as ChromeService")
-        self.lines.append("from selenium.webdriver.firefox.options import Options as FirefoxOptions")
-        self.lines.append("from selenium.webdriver.edge.options import Options as EdgeOptions")
-        self.lines.append("from selenium.webdriver.common.by import By")
-        self.lines.append("from selenium.webdriver.common.keys import Keys")
-        self.lines.append("from selenium.webdriver.support.ui import WebDriverWait")
-        self.lines.append("from selenium.webdriver.support import expected_conditions as EC")
-        self.lines.append("import time")
+    def _emit_program(self):
+        """Emit code for the whole program into ``self.buf``."""
+        self.buf = bytearray(_HEADER)
+        self._emit = self.buf.extend
+        
+        # Generate code for each statement
+        for statement in self.ast.statements:
+            self._generate_statement(statement)
     
     def _generate_statement(self, statement):
         """
@@ -73,75 +182,35 @@ class PythonCodeGenerator:
         Args:
             statement: An AST node representing a statement
         """
-        if isinstance(statement, OpenNode):
-            self._generate_open(statement)
-        elif isinstance(statement, GoNode):
-            self._generate_go(statement)
-        elif isinstance(statement, TypeNode):
-            self._generate_type(statement)
-        elif isinstance(statement, ClickNode):
-            self._generate_click(statement)
-        elif isinstance(statement, EnterNode):
-            self._generate_enter(statement)
-        elif isinstance(statement, WaitNode):
-            self._generate_wait(statement)
-        elif isinstance(statement, ScreenshotNode):
-            self._generate_screenshot(statement)
-        elif isinstance(statement, CloseNode):
-            self._generate_close(statement)
+        # Each node type forwards to its matching _generate_* method
+        statement._generate(self)
     
     def _generate_open(self, node: OpenNode):
         """Generate code for OpenNode: driver = webdriver.Browser() with anti-detection options"""
+        emit = self._emit
         browser = node.browser.lower()
-        if browser == 'chrome':
-            self.lines.append("# Configure Chrome options to avoid bot detection")
-            self.lines.append("chrome_options = ChromeOptions()")
-            self.lines.append("chrome_options.add_argument('--disable-blink-features=AutomationControlled')")
-            self.lines.append("chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])")
-            self.lines.append("chrome_options.add_experimental_option('useAutomationExtension', False)")
-            self.lines.append("chrome_options.add_argument('--disable-dev-shm-usage')")
-            self.lines.append("chrome_options.add_argument('--no-sandbox')")
-            self.lines.append("chrome_options.add_argument('--disable-gpu')")
-            self.lines.append("chrome_options.add_argument('--window-size=1920,1080')")
-            self.lines.append("chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')")
-            self.lines.append("driver = webdriver.Chrome(options=chrome_options)")
-            self.lines.append("# Execute script to remove webdriver property")
-            self.lines.append("driver.execute_script(\"Object.defineProperty(navigator, 'webdriver', {get: () => undefined})\")")
-        elif browser == 'firefox':
-            self.lines.append("# Configure Firefox options")
-            self.lines.append("firefox_options = FirefoxOptions()")
-            self.lines.append("firefox_options.set_preference('dom.webdriver.enabled', False)")
-            self.lines.append("firefox_options.set_preference('useAutomationExtension', False)")
-            self.lines.append("driver = webdriver.Firefox(options=firefox_options)")
-        elif browser == 'edge':
-            self.lines.append("# Configure Edge options")
-            self.lines.append("edge_options = EdgeOptions()")
-            self.lines.append("edge_options.add_argument('--disable-blink-features=AutomationControlled')")
-            self.lines.append("edge_options.add_experimental_option('excludeSwitches', ['enable-automation'])")
-            self.lines.append("edge_options.add_experimental_option('useAutomationExtension', False)")
-            self.lines.append("driver = webdriver.Edge(options=edge_options)")
-        elif browser == 'safari':
-            self.lines.append("driver = webdriver.Safari()")
-        else:
+        open_lines = _OPEN_LINES.get(browser)
+        if open_lines is None:
             # Default to Chrome with anti-detection
-            self.lines.append(f"# Unknown browser '{browser}', defaulting to Chrome")
-            self.lines.append("chrome_options = ChromeOptions()")
-            self.lines.append("chrome_options.add_argument('--disable-blink-features=AutomationControlled')")
-            self.lines.append("chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])")
-            self.lines.append("chrome_options.add_experimental_option('useAutomationExtension', False)")
-            self.lines.append("driver = webdriver.Chrome(options=chrome_options)")
-            self.lines.append("driver.execute_script(\"Object.defineProperty(navigator, 'webdriver', {get: () => undefined})\")")
+            emit(f"# Unknown browser '{browser}', defaulting to Chrome\n".encode('utf-8'))
+            open_lines = _DEFAULT_OPEN_LINES
+        emit(open_lines)
         # Add safety delay after opening browser
-        self.lines.append("time.sleep(2)")
+        emit(b"time.sleep(2)\n")
     
     def _generate_go(self, node: GoNode):
         """Generate code for GoNode: driver.get("<url>")"""
-        self.lines.append(f'driver.get("{node.url}")')
+        self._emit(f'driver.get("{node.url}")\n'.encode('utf-8'))
     
-    def _get_element_selector(self, selector: str, selector_type: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_element_selector(selector: str, selector_type: str) -> str:
         """
         Generate Selenium element selector code.
         
+        Memoized on (selector, selector_type), since scripts commonly interact
+        with the same element several times.
+        
         Args:
             selector: The selector value
             selector_type: Type of selector ('id', 'name', 'xpath', 'css', 'tag')
@@ -154,100 +223,71 @@ class PythonCodeGenerator:
             return 'driver.find_element(By.NAME, "q")'
         
         selector_type = selector_type.lower()
-        escaped_selector = selector.replace('"', '\\"')
-        
-        if selector_type == 'id':
-            return f'driver.find_element(By.ID, "{escaped_selector}")'
-        elif selector_type == 'name':
-            return f'driver.find_element(By.NAME, "{escaped_selector}")'
-        elif selector_type == 'xpath':
-            return f'driver.find_element(By.XPATH, "{escaped_selector}")'
-        elif selector_type == 'css':
-            return f'driver.find_element(By.CSS_SELECTOR, "{escaped_selector}")'
-        elif selector_type == 'tag':
-            return f'driver.find_element(By.TAG_NAME, "{escaped_selector}")'
-        else:
-            # Default fallback
-            return f'driver.find_element(By.NAME, "{escaped_selector}")'
+        escaped_selector = selector.translate(_ESCAPE_DQUOTE)
+        by = _BY.get(selector_type, 'By.NAME')  # Unknown types fall back to By.NAME
+        return f'driver.find_element({by}, "{escaped_selector}")'
     
     def _generate_type(self, node: TypeNode):
         """Generate code for TypeNode: driver.find_element(...).send_keys("<text>")"""
         # Escape quotes in the text
-        escaped_text = node.text.replace('"', '\\"')
+        escaped_text = node.text.translate(_ESCAPE_DQUOTE)
         element_code = self._get_element_selector(node.selector, node.selector_type)
-        self.lines.append(f'{element_code}.send_keys("{escaped_text}")')
+        self._emit(f'{element_code}.send_keys("{escaped_text}")\n'.encode('utf-8'))
     
     def _generate_click(self, node: ClickNode):
         """Generate code for ClickNode: driver.find_element(...).click() with fallback for multiple selectors"""
+        emit = self._emit
+        
         # Handle CSS selectors with multiple options (comma-separated)
         if node.selector_type == 'css' and ',' in node.selector:
             # Try multiple selectors
             selectors = [s.strip() for s in node.selector.split(',')]
-            self.lines.append("# Try multiple CSS selectors")
-            self.lines.append("element_found = False")
-            
-            # Build nested try-except structure
-            for i, selector in enumerate(selectors):
-                escaped_selector = selector.replace('"', '\\"').replace("'", "\\'")
-                
-                if i == 0:
-                    # First try block
-                    self.lines.append("try:")
-                    self.lines.append(f"    element = driver.find_element(By.CSS_SELECTOR, \"{escaped_selector}\")")
-                    self.lines.append(f"    element.click()")
-                    self.lines.append(f"    element_found = True")
-                else:
-                    # Nested except-try blocks
-                    # except should be at same level as previous try's content
-                    except_indent = "    " * (i - 1) if i > 1 else ""
-                    try_indent = "    " * i
-                    self.lines.append(f"{except_indent}except Exception:")
-                    self.lines.append(f"{try_indent}try:")
-                    self.lines.append(f"{try_indent}    element = driver.find_element(By.CSS_SELECTOR, \"{escaped_selector}\")")
-                    self.lines.append(f"{try_indent}    element.click()")
-                    self.lines.append(f"{try_indent}    element_found = True")
+            emit(b"# Try multiple CSS selectors\n")
+            emit(f"selectors_list = {selectors!r}\n".encode('utf-8'))
+            emit(b"element_found = False\n")
             
-            # Close the final nested except block
-            if len(selectors) > 1:
-                final_except_indent = "    " * (len(selectors) - 1)
-                self.lines.append(f"{final_except_indent}except Exception:")
-                self.lines.append(f"{final_except_indent}    pass")
+            # Try each selector in turn, stopping at the first one that clicks
+            emit(b"for _sel in selectors_list:\n")
+            emit(b"    try:\n")
+            emit(b"        driver.find_element(By.CSS_SELECTOR, _sel).click()\n")
+            emit(b"        element_found = True\n")
+            emit(b"        break\n")
+            emit(b"    except Exception:\n")
+            emit(b"        continue\n")
             
             # Check if element was found - continue gracefully if not found
-            self.lines.append("if not element_found:")
-            selectors_repr = ', '.join([f'"{s}"' for s in selectors])
-            self.lines.append(f"    selectors_list = [{selectors_repr}]")
-            self.lines.append("    print(f\"Warning: Could not find element with any of the selectors: {selectors_list}\")")
-            self.lines.append("    print(\"Continuing script execution...\")")
+            emit(b"if not element_found:\n")
+            emit(b"    print(f\"Warning: Could not find element with any of the selectors: {selectors_list}\")\n")
+            emit(b"    print(\"Continuing script execution...\")\n")
         else:
             # Single selector - wrap in try-except for graceful failure
             element_code = self._get_element_selector(node.selector, node.selector_type)
-            self.lines.append("try:")
-            self.lines.append(f"    {element_code}.click()")
-            self.lines.append("except Exception as e:")
+            emit(b"try:\n")
+            emit(f"    {element_code}.click()\n".encode('utf-8'))
+            emit(b"except Exception as e:\n")
             if node.selector:
-                # Use repr to properly escape the selector for display
-                selector_repr = repr(node.selector)
-                self.lines.append(f'    print("Warning: Could not find element with {node.selector_type} " + {selector_repr})')
+                # Quote the selector as a Python literal for display
+                selector_repr = _py_str_literal(node.selector)
+                emit(f'    print("Warning: Could not find element with {node.selector_type} " + {selector_repr})\n'.encode('utf-8'))
             else:
-                self.lines.append('    print("Warning: Could not find element with default selector")')
-            self.lines.append('    print(f"Error: {e}")')
-            self.lines.append("    print(\"Continuing script execution...\")")
+                emit(b'    print("Warning: Could not find element with default selector")\n')
+            emit(b'    print(f"Error: {e}")\n')
+            emit(b"    print(\"Continuing script execution...\")\n")
     
     def _generate_enter(self, node: EnterNode):
         """Generate code for EnterNode: driver.find_element(...).send_keys(Keys.ENTER)"""
         element_code = self._get_element_selector(node.selector, node.selector_type)
-        self.lines.append(f'{element_code}.send_keys(Keys.ENTER)')
+        self._emit(f'{element_code}.send_keys(Keys.ENTER)\n'.encode('utf-8'))
     
     def _generate_wait(self, node: WaitNode):
         """Generate code for WaitNode: time.sleep(<seconds>)"""
-        self.lines.append(f"time.sleep({node.seconds})")
+        self._emit(f"time.sleep({node.seconds})\n".encode('utf-8'))
     
     def _generate_screenshot(self, node: ScreenshotNode):
         """Generate code for ScreenshotNode: driver.save_screenshot("<filename>")"""
-        self.lines.append(f'driver.save_screenshot("{node.filename}")')
+        self._emit(f'driver.save_screenshot("{node.filename}")\n'.encode('utf-8'))
     
     def _generate_close(self, node: CloseNode):
         """Generate code for CloseNode: driver.quit()"""
-        self.lines.append("driver.quit()")
+        self._emit(b"driver.quit()\n")
 
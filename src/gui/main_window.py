@@ -3,12 +3,31 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext
 from pathlib import Path
+import hashlib
+import itertools
 import subprocess
+import sys
 import threading
+from dataclasses import dataclass
+from typing import List, Optional
 from ..lexer.lexer import Lexer, LexerError
-from ..parser.parser import Parser, ParserError
-from ..semantic.analyzer import SemanticAnalyzer, SemanticError
-from ..codegen.python_gen import PythonCodeGenerator
+from ..lexer.token import Token
+from ..parser.ast import ProgramNode
+from .. import cache
+
+
+# Longest listing shown in the Tokens and AST panels
+MAX_DISPLAY_LINES = 5000
+
+
+@dataclass
+class CompileResult:
+    """Outcome of a background compilation, applied on the Tk main thread."""
+    tokens: Optional[List[Token]] = None
+    ast: Optional[ProgramNode] = None
+    semantic_ok: bool = False
+    output_path: Optional[Path] = None
+    error: Optional[str] = None
 
 
 class MainWindow:
@@ -35,6 +54,9 @@ class MainWindow:
         # Store generated Python script path
         self.generated_script_path = None
         
+        # Maps each generated script to the (AST hash, mtime) it was written with
+        self._codegen_cache = {}
+        
         self._setup_window()
         self._create_layout()
     
@@ -318,6 +340,7 @@ class MainWindow:
         """
         Handle Compile button click event.
         Executes the compiler pipeline: lexer → parser → semantic analysis.
+        Runs in a separate thread to keep GUI responsive.
         """
         # Clear previous results
         self._clear_output_panels()
@@ -335,92 +358,188 @@ class MainWindow:
         
         # Read the file content
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
+            source = self._read_source(file_path)
         except Exception as e:
             self._show_error(f"Failed to read file: {e}")
             return
         
-        # Step 1: Lexical Analysis
-        try:
-            lexer = Lexer(source)
-            tokens = lexer.tokenize()
-            
-            # Display tokens in Tokens Panel
-            self._display_tokens(tokens)
+        # Get output directory from entry field (widgets are only read here)
+        output_dir_str = self.output_entry.get().strip()
+        if output_dir_str:
+            self.output_directory = Path(output_dir_str)
+        else:
+            self.output_directory = Path("output")
+        output_directory = self.output_directory
+        
+        # Disable Compile and Run buttons during compilation
+        self.compile_button.config(state=tk.DISABLED, text="Compiling...")
+        self.run_button.config(state=tk.DISABLED)
+        self.semantic_result_label.config(text="Compiling...", foreground="gray")
+        
+        # Compile in a separate thread to keep GUI responsive
+        def compile_in_background():
+            result = self._compile_worker(source, file_path, output_directory)
             
-        except LexerError as e:
-            self._show_error(f"Lexer Error: {e}")
-            return
-        except Exception as e:
-            self._show_error(f"Unexpected error during lexing: {e}")
-            return
+            # Update GUI in main thread
+            self.root.after(0, lambda: self._apply_compile_result(result))
         
-        # Step 2: Parsing
-        try:
-            parser = Parser(tokens)
-            ast = parser.parse()
+        # Start compilation in background thread
+        thread = threading.Thread(target=compile_in_background, daemon=True)
+        thread.start()
+    
+    @staticmethod
+    def _read_source(file_path):
+        """
+        Read a .task file as text, the same way the command-line compiler does.
+        
+        Text mode translates CRLF and bare CR line endings to '\\n', which
+        the lexer's line and column numbers rely on.
+        
+        Args:
+            file_path: Path of the selected .task file
             
-            # Display AST in AST Panel
-            self._display_ast(ast)
+        Returns:
+            The decoded source text
+        """
+        return file_path.read_text(encoding='utf-8')
+    
+    def _compile_worker(self, source, file_path, output_directory):
+        """
+        Run the compiler pipeline without touching any widgets.
+        
+        Never raises: any failure, including ones outside the per-stage
+        handlers, is reported through the result so the GUI is always
+        re-enabled.
+        
+        Args:
+            source: TaskLang source code
+            file_path: Path of the selected .task file
+            output_directory: Directory to write the generated script to
             
-        except ParserError as e:
-            self._show_error(f"Parser Error: {e}")
-            return
+        Returns:
+            CompileResult describing how far compilation got
+        """
+        result = CompileResult()
+        try:
+            self._run_pipeline(result, source, file_path, output_directory)
         except Exception as e:
-            self._show_error(f"Unexpected error during parsing: {e}")
-            return
+            result.error = f"Unexpected error during compilation: {e}"
+        return result
+    
+    def _run_pipeline(self, result, source, file_path, output_directory):
+        """
+        Compile a source, recording each stage's output in ``result``.
         
-        # Step 3: Semantic Analysis
-        try:
-            analyzer = SemanticAnalyzer(ast)
-            analyzer.analyze()
+        Args:
+            result: CompileResult to fill in
+            source: TaskLang source code
+            file_path: Path of the selected .task file
+            output_directory: Directory to write the generated script to
+        """
+        # Deferred so GUI startup does not pay for the rest of the pipeline
+        from ..parser.parser import Parser, ParserError
+        from ..semantic.analyzer import SemanticAnalyzer, SemanticError
+        from ..codegen.python_gen import PythonCodeGenerator
+        
+        # Unchanged sources skip lexing, parsing and semantic analysis
+        cached = cache.load(source)
+        if cached is not None:
+            result.tokens, result.ast = cached
+            result.semantic_ok = True
+        else:
+            # Step 1: Lexical Analysis
+            try:
+                lexer = Lexer(source)
+                result.tokens = lexer.tokenize()
+            except LexerError as e:
+                result.error = f"Lexer Error: {e}"
+                return
+            except Exception as e:
+                result.error = f"Unexpected error during lexing: {e}"
+                return
             
-            # Display success message
-            self._show_semantic_success("✅ Semantic Analysis Passed")
+            # Step 2: Parsing
+            try:
+                parser = Parser(result.tokens)
+                result.ast = parser.parse()
+            except ParserError as e:
+                result.error = f"Parser Error: {e}"
+                return
+            except Exception as e:
+                result.error = f"Unexpected error during parsing: {e}"
+                return
             
-        except SemanticError as e:
-            self._show_error(f"Semantic Error: {e}")
-            return
-        except Exception as e:
-            self._show_error(f"Unexpected error during semantic analysis: {e}")
-            return
+            # Step 3: Semantic Analysis
+            try:
+                analyzer = SemanticAnalyzer(result.ast)
+                analyzer.analyze()
+                result.semantic_ok = True
+            except SemanticError as e:
+                result.error = f"Semantic Error: {e}"
+                return
+            except Exception as e:
+                result.error = f"Unexpected error during semantic analysis: {e}"
+                return
+            
+            cache.store(source, result.tokens, result.ast)
         
         # Step 4: Python Code Generation
         try:
-            # Get output directory from entry field
-            output_dir_str = self.output_entry.get().strip()
-            if output_dir_str:
-                self.output_directory = Path(output_dir_str)
-            else:
-                self.output_directory = Path("output")
-            
             # Ensure output directory exists
-            self.output_directory.mkdir(parents=True, exist_ok=True)
-            
-            # Determine output filename
-            input_filename = file_path.stem  # Get filename without extension
-            
-            # Construct output file path
-            output_file = self.output_directory / f"{input_filename}.py"
+            output_directory.mkdir(parents=True, exist_ok=True)
             
-            # Generate Python code
-            generator = PythonCodeGenerator(ast)
-            generator.generate(str(output_file))
+            # Construct output file path from the input filename
+            output_file = output_directory / f"{file_path.stem}.py"
             
-            # Store generated script path
-            self.generated_script_path = output_file
+            # Skip regeneration when this AST was already written there and
+            # the file has not been touched since
+            ast_key = hashlib.sha256("\n".join(result.ast.statement_keys()).encode('utf-8')).hexdigest()
+            try:
+                current = (ast_key, output_file.stat().st_mtime_ns)
+            except OSError:
+                current = None
             
-            # Display success message with file path
-            self._show_output_success(f"✅ Python automation script generated at {output_file}")
+            if current is None or self._codegen_cache.get(output_file) != current:
+                # Generate Python code
+                generator = PythonCodeGenerator(result.ast)
+                generator.generate(str(output_file))
+                self._codegen_cache[output_file] = (ast_key, output_file.stat().st_mtime_ns)
             
-            # Enable Run button
-            self.run_button.config(state=tk.NORMAL)
+            result.output_path = output_file
             
         except Exception as e:
-            self._show_error(f"Failed to generate Python code: {e}")
+            result.error = f"Failed to generate Python code: {e}"
+    
+    def _apply_compile_result(self, result):
+        """
+        Display the outcome of a background compilation.
+        
+        Args:
+            result: CompileResult produced by _compile_worker
+        """
+        # Re-enable Compile button
+        self.compile_button.config(state=tk.NORMAL, text="Compile")
+        
+        if result.tokens is not None:
+            self._display_tokens(result.tokens)
+        if result.ast is not None:
+            self._display_ast(result.ast)
+        if result.semantic_ok:
+            self._show_semantic_success("✅ Semantic Analysis Passed")
+        
+        if result.error:
+            self._show_error(result.error)
             self.run_button.config(state=tk.DISABLED)
             return
+        
+        # Store generated script path
+        self.generated_script_path = result.output_path
+        
+        # Display success message with file path
+        self._show_output_success(f"✅ Python automation script generated at {result.output_path}")
+        
+        # Enable Run button
+        self.run_button.config(state=tk.NORMAL)
     
     def _clear_output_panels(self):
         """Clear all output panels."""
@@ -457,8 +576,12 @@ class MainWindow:
         if not tokens:
             self.tokens_text.insert(tk.END, "No tokens found.")
         else:
-            for token in tokens:
-                self.tokens_text.insert(tk.END, f"{token}\n")
+            # One insert instead of one per token keeps Tk reflow to a single pass
+            shown = tokens[:MAX_DISPLAY_LINES]
+            text = "".join(f"{token}\n" for token in shown)
+            if len(tokens) > MAX_DISPLAY_LINES:
+                text += f"... {len(tokens) - MAX_DISPLAY_LINES} more tokens not shown\n"
+            self.tokens_text.insert(tk.END, text)
         
         self.tokens_text.config(state=tk.DISABLED)
     
@@ -472,8 +595,15 @@ class MainWindow:
         self.ast_text.config(state=tk.NORMAL)
         self.ast_text.delete(1.0, tk.END)
         
-        # Convert AST to string representation
-        ast_str = str(ast)
+        # Only format the first MAX_DISPLAY_LINES lines of large trees; the
+        # rendering is one line per statement plus the two bracket lines, or
+        # a single line for an empty program
+        shown = list(itertools.islice(ast.iter_lines(), MAX_DISPLAY_LINES))
+        total = len(ast.statements) + 2 if ast.statements else 1
+        hidden = total - len(shown)
+        if hidden:
+            shown.append(f"... {hidden} more lines not shown")
+        ast_str = "\n".join(shown)
         self.ast_text.insert(tk.END, ast_str)
         
         self.ast_text.config(state=tk.DISABLED)
@@ -531,9 +661,9 @@ class MainWindow:
         # Run script in a separate thread to keep GUI responsive
         def execute_script():
             try:
-                # Execute the Python script
+                # Execute the Python script with the interpreter running the GUI
                 result = subprocess.run(
-                    ["python", str(self.generated_script_path)],
+                    [sys.executable, str(self.generated_script_path)],
                     capture_output=True,
                     text=True,
                     timeout=300  # 5 minute timeout
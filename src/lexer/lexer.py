@@ -1,10 +1,33 @@
 """Lexer module for TaskLang Compiler."""
 
 import re
-from typing import List, Optional
+import sys
+from typing import List
 from .token import Token
 
 
+# Master scanner: one alternative per token class, tried in priority order,
+# each preceded by the whitespace and comments that lead up to it so the
+# Python loop runs once per token rather than once per token and gap.
+# A comment must run to the end of its line so the scanner cannot backtrack
+# into it. STRING_BAD catches a double quote that is not closed on the same
+# line; END matches the trivia at the end of the source.
+_MASTER_RE = re.compile(r'''
+    (?:\s|\#[^\n]*(?![^\n]))*
+    (?:
+        (?P<URL>https?://[^\s]+)
+      | (?P<STRING>"[^"\n]*")
+      | (?P<NUMBER>\d+)
+      | (?P<IDENT>[a-zA-Z_][a-zA-Z0-9_.]*)
+      | (?P<STRING_BAD>")
+      | (?P<END>\Z)
+    )
+''', re.VERBOSE)
+
+# Leading whitespace and comments only, used to locate an unexpected character
+_TRIVIA_RE = re.compile(r'(?:\s|\#[^\n]*(?![^\n]))*')
+
+
 class LexerError(Exception):
     """Exception raised when lexer encounters an error."""
     
@@ -26,18 +49,24 @@ class LexerError(Exception):
 class Lexer:
     """Lexical analyzer for TaskLang."""
     
-    # Keyword mapping
+    # Keyword mapping (token types interned for fast identity comparison)
     KEYWORDS = {
-        'open': 'OPEN',
-        'go': 'GO',
-        'type': 'TYPE',
-        'click': 'CLICK',
-        'enter': 'ENTER',
-        'wait': 'WAIT',
-        'screenshot': 'SCREENSHOT',
-        'close': 'CLOSE',
+        keyword: sys.intern(token_type)
+        for keyword, token_type in {
+            'open': 'OPEN',
+            'go': 'GO',
+            'type': 'TYPE',
+            'click': 'CLICK',
+            'enter': 'ENTER',
+            'wait': 'WAIT',
+            'screenshot': 'SCREENSHOT',
+            'close': 'CLOSE',
+        }.items()
     }
     
+    # Longer identifiers can never be keywords, so they skip the lower-casing
+    _MAX_KEYWORD_LEN = max(map(len, KEYWORDS))
+    
     def __init__(self, source: str):
         """
         Initialize the lexer with source code.
@@ -47,12 +76,6 @@ class Lexer:
         """
         self.source = source
         self.tokens: List[Token] = []
-        self.pos = 0
-        self.line = 1
-        self.column = 1
-        self.start_pos = 0
-        self.start_line = 1
-        self.start_column = 1
     
     def tokenize(self) -> List[Token]:
         """
@@ -64,181 +87,62 @@ class Lexer:
         Raises:
             LexerError: If an invalid token or unterminated string is found
         """
-        self.tokens = []
-        self.pos = 0
-        self.line = 1
-        self.column = 1
-        
-        while self.pos < len(self.source):
-            self.start_pos = self.pos
-            self.start_line = self.line
-            self.start_column = self.column
-            
-            # Skip whitespace (but track newlines)
-            if self._match(r'\s'):
-                if self.source[self.pos - 1] == '\n':
-                    self.line += 1
-                    self.column = 1
-                continue
-            
-            # Skip comments (lines starting with #)
-            if self._match(r'#.*'):
-                # Skip until newline
-                while self.pos < len(self.source) and self.source[self.pos] != '\n':
-                    self.pos += 1
-                continue
-            
-            # Match tokens in order of specificity
-            
-            # URL pattern (must come before identifier)
-            if token := self._match_url():
-                self.tokens.append(token)
-                continue
-            
-            # String literals (double quoted)
-            if token := self._match_string():
-                self.tokens.append(token)
-                continue
-            
-            # Numbers (integers)
-            if token := self._match_number():
-                self.tokens.append(token)
-                continue
-            
-            # Keywords and identifiers
-            if token := self._match_keyword_or_identifier():
-                self.tokens.append(token)
-                continue
-            
-            # If we get here, we have an unknown character
-            raise LexerError(
-                f"Unexpected character: {self.source[self.pos]!r}",
-                self.line,
-                self.column
-            )
-        
-        return self.tokens
-    
-    def _match(self, pattern: str) -> bool:
-        """
-        Try to match a pattern at the current position.
+        source = self.source
+        tokens = []
+        keywords = self.KEYWORDS
+        max_keyword_len = self._MAX_KEYWORD_LEN
+        line = 1
+        line_start = 0  # Offset of the first character of the current line
+        pos = 0
         
-        Args:
-            pattern: Regular expression pattern
+        match_token = _MASTER_RE.match
+        while True:
+            match = match_token(source, pos)
+            if match is None:
+                # Nothing can be scanned at pos
+                break
+            kind = match.lastgroup
+            start = match.start(kind)
             
-        Returns:
-            True if pattern matched, False otherwise
-        """
-        regex = re.compile(pattern)
-        match = regex.match(self.source, self.pos)
-        if match:
-            matched_text = match.group(0)
-            self.pos += len(matched_text)
-            self.column += len(matched_text)
-            return True
-        return False
-    
-    def _match_string(self) -> Optional[Token]:
-        """
-        Match a string literal (double quoted).
-        
-        Returns:
-            Token if matched, None otherwise
+            # Track newlines inside the leading whitespace and comments
+            newlines = source.count('\n', pos, start)
+            if newlines:
+                line += newlines
+                line_start = source.rindex('\n', pos, start) + 1
+            pos = match.end()
             
-        Raises:
-            LexerError: If string is unterminated
-        """
-        if self.pos >= len(self.source) or self.source[self.pos] != '"':
-            return None
-        
-        # Start of string
-        self.pos += 1
-        self.column += 1
-        start_col = self.column
-        
-        # Find the end of the string
-        while self.pos < len(self.source):
-            if self.source[self.pos] == '"':
-                # Found closing quote
-                value = self.source[self.start_pos + 1:self.pos]
-                self.pos += 1
-                self.column += 1
-                return Token('STRING', value, self.start_line, self.start_column)
-            elif self.source[self.pos] == '\n':
-                # String spans multiple lines - error
-                raise LexerError(
-                    "Unterminated string literal",
-                    self.start_line,
-                    self.start_column
-                )
+            column = start - line_start + 1
+            if kind == 'IDENT':
+                value = match.group(kind)
+                # Keywords are case-insensitive; lowercase source hits the table directly
+                token_type = keywords.get(value)
+                if token_type is None:
+                    if len(value) <= max_keyword_len:
+                        token_type = keywords.get(value.lower(), 'IDENTIFIER')
+                    else:
+                        token_type = 'IDENTIFIER'
+                tokens.append(Token(token_type, value, line, column))
+            elif kind == 'STRING':
+                tokens.append(Token('STRING', source[start + 1:pos - 1], line, column))
+            elif kind == 'END':
+                break
+            elif kind == 'STRING_BAD':
+                raise LexerError("Unterminated string literal", line, column)
             else:
-                self.pos += 1
-                self.column += 1
-        
-        # Reached end of file without closing quote
-        raise LexerError(
-            "Unterminated string literal",
-            self.start_line,
-            self.start_column
-        )
-    
-    def _match_number(self) -> Optional[Token]:
-        """
-        Match an integer number.
-        
-        Returns:
-            Token if matched, None otherwise
-        """
-        if self.pos >= len(self.source) or not self.source[self.pos].isdigit():
-            return None
-        
-        # Match one or more digits
-        start_col = self.column
-        value = ''
-        while self.pos < len(self.source) and self.source[self.pos].isdigit():
-            value += self.source[self.pos]
-            self.pos += 1
-            self.column += 1
+                tokens.append(Token(kind, match.group(kind), line, column))
         
-        return Token('NUMBER', value, self.start_line, self.start_column)
-    
-    def _match_url(self) -> Optional[Token]:
-        """
-        Match a URL (http:// or https://).
-        
-        Returns:
-            Token if matched, None otherwise
-        """
-        # Match http:// or https:// followed by URL characters
-        pattern = r'https?://[^\s\n]+'
-        regex = re.compile(pattern)
-        match = regex.match(self.source, self.pos)
-        if match:
-            value = match.group(0)
-            token = Token('URL', value, self.start_line, self.start_column)
-            self.pos += len(value)
-            self.column += len(value)
-            return token
-        return None
-    
-    def _match_keyword_or_identifier(self) -> Optional[Token]:
-        """
-        Match a keyword or identifier.
+        if pos != len(source):
+            # Step over the trivia in front of the offending character
+            bad = _TRIVIA_RE.match(source, pos).end()
+            newlines = source.count('\n', pos, bad)
+            if newlines:
+                line += newlines
+                line_start = source.rindex('\n', pos, bad) + 1
+            raise LexerError(
+                f"Unexpected character: {source[bad]!r}",
+                line,
+                bad - line_start + 1
+            )
         
-        Returns:
-            Token if matched, None otherwise
-        """
-        # Match identifier: starts with letter or underscore, followed by letters, digits, underscores, dots
-        pattern = r'[a-zA-Z_][a-zA-Z0-9_.]*'
-        regex = re.compile(pattern)
-        match = regex.match(self.source, self.pos)
-        if match:
-            value = match.group(0)
-            # Check if it's a keyword
-            token_type = self.KEYWORDS.get(value.lower(), 'IDENTIFIER')
-            token = Token(token_type, value, self.start_line, self.start_column)
-            self.pos += len(value)
-            self.column += len(value)
-            return token
-        return None
-
+        self.tokens = tokens
+        return tokens
@@ -1,9 +1,21 @@
 """Token class for TaskLang Compiler."""
 
+import sys
+
+
+# Canonical interned token type names, so parser comparisons hit the identity fast path
+_TYPES = frozenset([
+    'OPEN', 'GO', 'TYPE', 'CLICK', 'ENTER', 'WAIT', 'SCREENSHOT', 'CLOSE',
+    'STRING', 'NUMBER', 'URL', 'IDENTIFIER',
+])
+_INTERN = {t: sys.intern(t) for t in _TYPES}
+
 
 class Token:
     """Represents a token in the TaskLang source code."""
     
+    __slots__ = ('type', 'value', 'line', 'column', '_repr_cache')
+    
     def __init__(self, type: str, value: str, line: int, column: int):
         """
         Initialize a Token.
@@ -14,14 +26,18 @@ class Token:
             line: Line number where the token appears (1-indexed)
             column: Column number where the token starts (1-indexed)
         """
-        self.type = type
+        self.type = _INTERN.get(type) or sys.intern(type)
         self.value = value
         self.line = line
         self.column = column
+        self._repr_cache = None  # Filled in by the first __repr__ call
     
     def __repr__(self) -> str:
         """Return string representation of the token."""
-        return f"TOKEN({self.type}, {self.value!r}, {self.line}, {self.column})"
+        text = self._repr_cache
+        if text is None:
+            text = self._repr_cache = f"TOKEN({self.type}, {self.value!r}, {self.line}, {self.column})"
+        return text
     
     def __eq__(self, other) -> bool:
         """Check equality of two tokens."""
@@ -1,17 +1,52 @@
 """Abstract Syntax Tree nodes for TaskLang Compiler."""
 
+import sys
+
+
+# Canonical interned selector type names
+_SELECTOR_TYPES = {t: sys.intern(t) for t in ('id', 'name', 'xpath', 'css', 'tag')}
+
+# Tree-drawing prefixes for the program rendering
+_BRANCH = "  ├─ "
+_LAST = "  └─ "
+
 
 class ASTNode:
     """Base class for all AST nodes."""
     
+    # _repr_cache memoizes the repr for display; it stays unset until first
+    # requested and does not see in-place edits, so cache keys must be built
+    # with ProgramNode.statement_keys() instead
+    __slots__ = ('_repr_cache',)
+    
     def __repr__(self) -> str:
         """Return string representation of the node."""
+        try:
+            return self._repr_cache
+        except AttributeError:
+            text = self._repr_cache = self._format()
+            return text
+    
+    def _invalidate(self):
+        """Discard the memoized repr after the node has been modified."""
+        try:
+            del self._repr_cache
+        except AttributeError:
+            pass
+    
+    def _format(self) -> str:
+        """Build the string representation of the node."""
         return self.__class__.__name__
+    
+    def _generate(self, generator):
+        """Emit code for this node via the matching generator method (no-op by default)."""
 
 
 class ProgramNode(ASTNode):
     """Root node representing a complete program."""
     
+    __slots__ = ('_statements',)
+    
     def __init__(self, statements):
         """
         Initialize a ProgramNode.
@@ -21,28 +56,62 @@ class ProgramNode(ASTNode):
         """
         self.statements = statements
     
-    def __repr__(self) -> str:
-        """Return string representation of the program."""
-        if not self.statements:
-            return "ProgramNode([])"
+    @property
+    def statements(self):
+        """List of statement nodes in source order."""
+        return self._statements
+    
+    @statements.setter
+    def statements(self, statements):
+        # A new statement list invalidates the memoized rendering
+        self._statements = statements
+        self._invalidate()
+    
+    def _format(self) -> str:
+        """Build the string representation of the program."""
+        return "\n".join(self.iter_lines())
+    
+    def statement_keys(self):
+        """
+        Render every statement from its current field values.
+        
+        Unlike repr(), nothing here is memoized, so the keys reflect
+        statements that were added, removed or modified in place.
+        
+        Returns:
+            Tuple with one string per statement, in source order
+        """
+        return tuple(stmt._format() for stmt in self.statements)
+    
+    def iter_lines(self):
+        """
+        Yield the tree rendering of the program one line at a time.
+        
+        Lines are produced on demand so callers that only show part of a
+        large program never format the rest.
+        
+        Yields:
+            Lines of the rendering, without trailing newlines
+        """
+        statements = self.statements
+        if not statements:
+            yield "ProgramNode([])"
+            return
         
-        lines = ["ProgramNode("]
-        for i, stmt in enumerate(self.statements):
-            prefix = "  ├─ " if i < len(self.statements) - 1 else "  └─ "
-            stmt_repr = repr(stmt)
-            # Indent child nodes
-            stmt_lines = stmt_repr.split('\n')
-            lines.append(prefix + stmt_lines[0])
-            for line in stmt_lines[1:]:
-                connector = "  │  " if i < len(self.statements) - 1 else "     "
-                lines.append(connector + line)
-        lines.append(")")
-        return "\n".join(lines)
+        # Statements are leaves whose reprs quote every field, so each one
+        # is a single line and needs no re-indenting
+        yield "ProgramNode("
+        for stmt in statements[:-1]:
+            yield _BRANCH + repr(stmt)
+        yield _LAST + repr(statements[-1])
+        yield ")"
 
 
 class OpenNode(ASTNode):
     """Node representing an 'open' statement."""
     
+    __slots__ = ('browser',)
+    
     def __init__(self, browser: str):
         """
         Initialize an OpenNode.
@@ -52,14 +121,20 @@ class OpenNode(ASTNode):
         """
         self.browser = browser
     
-    def __repr__(self) -> str:
-        """Return string representation of the node."""
+    def _format(self) -> str:
+        """Build the string representation of the node."""
         return f"OpenNode(browser={self.browser!r})"
+    
+    def _generate(self, generator):
+        """Emit code for this node via the code generator."""
+        generator._generate_open(self)
 
 
 class GoNode(ASTNode):
     """Node representing a 'go' statement."""
     
+    __slots__ = ('url',)
+    
     def __init__(self, url: str):
         """
         Initialize a GoNode.
@@ -69,79 +144,92 @@ class GoNode(ASTNode):
         """
         self.url = url
     
-    def __repr__(self) -> str:
-        """Return string representation of the node."""
+    def _format(self) -> str:
+        """Build the string representation of the node."""
         return f"GoNode(url={self.url!r})"
+    
+    def _generate(self, generator):
+        """Emit code for this node via the code generator."""
+        generator._generate_go(self)
 
 
-class TypeNode(ASTNode):
-    """Node representing a 'type' statement."""
+class _Selectable(ASTNode):
+    """Base for statements that may target an element through a selector."""
     
-    def __init__(self, text: str, selector: str = None, selector_type: str = None):
+    __slots__ = ('selector', 'selector_type')
+    
+    def __init__(self, selector: str = None, selector_type: str = None):
         """
-        Initialize a TypeNode.
+        Initialize the selector fields.
         
         Args:
-            text: Text to type
             selector: Element selector (id, name, xpath, css, etc.)
             selector_type: Type of selector ('id', 'name', 'xpath', 'css', 'tag')
         """
-        self.text = text
         self.selector = selector
-        self.selector_type = selector_type
+        # Share one string object per known selector type across all nodes
+        self.selector_type = _SELECTOR_TYPES.get(selector_type, selector_type)
     
-    def __repr__(self) -> str:
-        """Return string representation of the node."""
+    def _format(self) -> str:
+        """Build the string representation of the node."""
         if self.selector:
-            return f"TypeNode(text={self.text!r}, selector={self.selector!r}, selector_type={self.selector_type!r})"
-        return f"TypeNode(text={self.text!r})"
+            return f"{type(self).__name__}(selector={self.selector!r}, selector_type={self.selector_type!r})"
+        return f"{type(self).__name__}()"
 
 
-class ClickNode(ASTNode):
-    """Node representing a 'click' statement."""
+class TypeNode(_Selectable):
+    """Node representing a 'type' statement."""
     
-    def __init__(self, selector: str = None, selector_type: str = None):
+    __slots__ = ('text',)
+    
+    def __init__(self, text: str, selector: str = None, selector_type: str = None):
         """
-        Initialize a ClickNode.
+        Initialize a TypeNode.
         
         Args:
+            text: Text to type
             selector: Element selector (id, name, xpath, css, etc.)
             selector_type: Type of selector ('id', 'name', 'xpath', 'css', 'tag')
         """
-        self.selector = selector
-        self.selector_type = selector_type
+        self.text = text
+        super().__init__(selector, selector_type)
     
-    def __repr__(self) -> str:
-        """Return string representation of the node."""
+    def _format(self) -> str:
+        """Build the string representation of the node."""
         if self.selector:
-            return f"ClickNode(selector={self.selector!r}, selector_type={self.selector_type!r})"
-        return "ClickNode()"
+            return f"TypeNode(text={self.text!r}, selector={self.selector!r}, selector_type={self.selector_type!r})"
+        return f"TypeNode(text={self.text!r})"
+    
+    def _generate(self, generator):
+        """Emit code for this node via the code generator."""
+        generator._generate_type(self)
+
+
+class ClickNode(_Selectable):
+    """Node representing a 'click' statement."""
+    
+    __slots__ = ()
+    
+    def _generate(self, generator):
+        """Emit code for this node via the code generator."""
+        generator._generate_click(self)
 
 
-class EnterNode(ASTNode):
+class EnterNode(_Selectable):
     """Node representing an 'enter' statement."""
     
-    def __init__(self, selector: str = None, selector_type: str = None):
-        """
-        Initialize an EnterNode.
-        
-        Args:
-            selector: Element selector (id, name, xpath, css, etc.)
-            selector_type: Type of selector ('id', 'name', 'xpath', 'css', 'tag')
-        """
-        self.selector = selector
-        self.selector_type = selector_type
+    __slots__ = ()
     
-    def __repr__(self) -> str:
-        """Return string representation of the node."""
-        if self.selector:
-            return f"EnterNode(selector={self.selector!r}, selector_type={self.selector_type!r})"
-        return "EnterNode()"
+    def _generate(self, generator):
+        """Emit code for this node via the code generator."""
+        generator._generate_enter(self)
 
 
 class WaitNode(ASTNode):
     """Node representing a 'wait' statement."""
     
+    __slots__ = ('seconds',)
+    
     def __init__(self, seconds: int):
         """
         Initialize a WaitNode.
@@ -151,14 +239,20 @@ class WaitNode(ASTNode):
         """
         self.seconds = seconds
     
-    def __repr__(self) -> str:
-        """Return string representation of the node."""
+    def _format(self) -> str:
+        """Build the string representation of the node."""
         return f"WaitNode(seconds={self.seconds})"
+    
+    def _generate(self, generator):
+        """Emit code for this node via the code generator."""
+        generator._generate_wait(self)
 
 
 class ScreenshotNode(ASTNode):
     """Node representing a 'screenshot' statement."""
     
+    __slots__ = ('filename',)
+    
     def __init__(self, filename: str):
         """
         Initialize a ScreenshotNode.
@@ -168,15 +262,25 @@ class ScreenshotNode(ASTNode):
         """
         self.filename = filename
     
-    def __repr__(self) -> str:
-        """Return string representation of the node."""
+    def _format(self) -> str:
+        """Build the string representation of the node."""
         return f"ScreenshotNode(filename={self.filename!r})"
+    
+    def _generate(self, generator):
+        """Emit code for this node via the code generator."""
+        generator._generate_screenshot(self)
 
 
 class CloseNode(ASTNode):
     """Node representing a 'close' statement."""
     
-    def __repr__(self) -> str:
-        """Return string representation of the node."""
+    __slots__ = ()
+    
+    def _format(self) -> str:
+        """Build the string representation of the node."""
         return "CloseNode()"
+    
+    def _generate(self, generator):
+        """Emit code for this node via the code generator."""
+        generator._generate_close(self)
 
@@ -1,5 +1,6 @@
 """Parser module for TaskLang Compiler."""
 
+import sys
 from typing import List, Optional
 from .ast import (
     ProgramNode, OpenNode, GoNode, TypeNode, EnterNode,
@@ -7,6 +8,10 @@ from .ast import (
 )
 
 
+# Identifiers accepted as a selector type after click/type/enter
+_SELECTOR_TYPES = frozenset(['id', 'name', 'xpath', 'css', 'tag'])
+
+
 class ParserError(Exception):
     """Exception raised when parser encounters a syntax error."""
     
@@ -28,6 +33,8 @@ class ParserError(Exception):
 class Parser:
     """Recursive descent parser for TaskLang."""
     
+    __slots__ = ('tokens', 'pos')
+    
     def __init__(self, tokens: List):
         """
         Initialize the parser with a list of tokens.
@@ -49,9 +56,11 @@ class Parser:
             ParserError: If a syntax error is encountered
         """
         statements = []
+        parse_statement = self.parse_statement
+        n = len(self.tokens)
         
-        while not self._is_at_end():
-            stmt = self.parse_statement()
+        while self.pos < n:
+            stmt = parse_statement()
             if stmt:
                 statements.append(stmt)
         
@@ -67,39 +76,24 @@ class Parser:
         Raises:
             ParserError: If a syntax error is encountered
         """
-        if self._is_at_end():
+        if self.pos >= len(self.tokens):
             return None
         
-        token = self._peek()
-        
-        if token.type == 'OPEN':
-            return self._parse_open_stmt()
-        elif token.type == 'GO':
-            return self._parse_go_stmt()
-        elif token.type == 'TYPE':
-            return self._parse_type_stmt()
-        elif token.type == 'CLICK':
-            return self._parse_click_stmt()
-        elif token.type == 'ENTER':
-            return self._parse_enter_stmt()
-        elif token.type == 'WAIT':
-            return self._parse_wait_stmt()
-        elif token.type == 'SCREENSHOT':
-            return self._parse_screenshot_stmt()
-        elif token.type == 'CLOSE':
-            return self._parse_close_stmt()
-        else:
+        token = self.tokens[self.pos]
+        parse = self._STMT_PARSERS.get(token.type)
+        if parse is None:
             raise ParserError(
                 f"Unexpected token: {token.type}",
                 token.line,
                 token.column
             )
+        return parse(self)
     
     def _parse_open_stmt(self) -> OpenNode:
         """Parse an 'open' statement: OPEN IDENTIFIER"""
         open_token = self._consume('OPEN', "Expected 'open' keyword")
         browser_token = self._consume('IDENTIFIER', "Expected browser identifier after 'open'")
-        return OpenNode(browser_token.value)
+        return OpenNode(sys.intern(browser_token.value))
     
     def _parse_go_stmt(self) -> GoNode:
         """Parse a 'go' statement: GO URL"""
@@ -160,21 +154,17 @@ class Parser:
         self._consume('CLOSE', "Expected 'close' keyword")
         return CloseNode()
     
-    def _peek(self):
-        """Return the current token without consuming it."""
-        if self._is_at_end():
-            return None
-        return self.tokens[self.pos]
-    
-    def _advance(self):
-        """Consume and return the current token."""
-        if not self._is_at_end():
-            self.pos += 1
-        return self.tokens[self.pos - 1] if self.pos > 0 else None
-    
-    def _is_at_end(self) -> bool:
-        """Check if we've consumed all tokens."""
-        return self.pos >= len(self.tokens)
+    # Statement keyword token type -> parse method
+    _STMT_PARSERS = {
+        'OPEN': _parse_open_stmt,
+        'GO': _parse_go_stmt,
+        'TYPE': _parse_type_stmt,
+        'CLICK': _parse_click_stmt,
+        'ENTER': _parse_enter_stmt,
+        'WAIT': _parse_wait_stmt,
+        'SCREENSHOT': _parse_screenshot_stmt,
+        'CLOSE': _parse_close_stmt,
+    }
     
     def _parse_optional_selector(self):
         """
@@ -184,49 +174,49 @@ class Parser:
         Returns:
             Tuple of (selector_value, selector_type) or (None, None) if no selector
         """
-        if self._is_at_end():
+        tokens = self.tokens
+        n = len(tokens)
+        pos = self.pos
+        if pos >= n:
             return None, None
         
-        token = self._peek()
+        token = tokens[pos]
         
         # Check for optional "in" keyword
-        has_in = False
         if token.type == 'IDENTIFIER' and token.value.lower() == 'in':
-            has_in = True
-            self._advance()
-            if self._is_at_end():
+            pos += 1
+            self.pos = pos
+            if pos >= n:
                 return None, None
-            token = self._peek()
+            token = tokens[pos]
         
         # Check if it's a selector type (id, name, xpath, css, tag)
         if token.type != 'IDENTIFIER':
             return None, None
         
         selector_type = token.value.lower()
-        if selector_type not in ['id', 'name', 'xpath', 'css', 'tag']:
+        if selector_type not in _SELECTOR_TYPES:
             return None, None
         
         # Consume selector type
-        self._advance()
+        pos += 1
+        self.pos = pos
         
         # Get selector value (string or identifier)
-        if self._is_at_end():
+        if pos >= n:
             raise ParserError(
                 f"Expected selector value after {selector_type}",
                 token.line,
                 token.column
             )
         
-        value_token = self._peek()
-        if value_token.type == 'STRING':
-            self._advance()
-            return value_token.value, selector_type
-        elif value_token.type == 'IDENTIFIER':
-            self._advance()
+        value_token = tokens[pos]
+        if value_token.type == 'STRING' or value_token.type == 'IDENTIFIER':
+            self.pos = pos + 1
             return value_token.value, selector_type
-        else:
-            # No selector found
-            return None, None
+        
+        # No selector found
+        return None, None
     
     def _consume(self, expected_type: str, error_message: str):
         """
@@ -242,9 +232,11 @@ class Parser:
         Raises:
             ParserError: If the current token doesn't match the expected type
         """
-        if self._is_at_end():
+        tokens = self.tokens
+        pos = self.pos
+        if pos >= len(tokens):
             # Use the last token's position for error reporting
-            last_token = self.tokens[-1] if self.tokens else None
+            last_token = tokens[-1] if tokens else None
             if last_token:
                 raise ParserError(
                     f"{error_message} (reached end of file)",
@@ -258,7 +250,7 @@ class Parser:
                     1
                 )
         
-        token = self._peek()
+        token = tokens[pos]
         if token.type != expected_type:
             raise ParserError(
                 f"{error_message}, but found {token.type} ({token.value!r})",
@@ -266,5 +258,5 @@ class Parser:
                 token.column
             )
         
-        return self._advance()
-
+        self.pos = pos + 1
+        return token
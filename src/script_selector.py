@@ -1,10 +1,16 @@
 """Interactive script selector and launcher for TaskLang Compiler."""
 
-import sys
+import codecs
 import os
 from pathlib import Path
-from typing import List, Optional
-from .cli import TaskLangCLI
+from typing import Dict, List, Optional, Tuple, Union
+
+
+# Number of bytes read from each script for its menu preview
+_PREVIEW_BYTES = 100
+
+# Menu choice that compiles every listed script
+_ALL_CHOICE = 'a'
 
 
 class ScriptSelector:
@@ -19,6 +25,7 @@ class ScriptSelector:
         """
         self.examples_dir = Path(examples_dir)
         self.scripts: List[Path] = []
+        self._previews: Dict[Path, Tuple[int, str]] = {}
         self._load_scripts()
     
     def _load_scripts(self):
@@ -27,7 +34,12 @@ class ScriptSelector:
             print(f"Warning: Examples directory '{self.examples_dir}' not found.")
             return
         
-        self.scripts = sorted(self.examples_dir.glob("*.task"))
+        # DirEntry reuses the type information from the directory read
+        with os.scandir(self.examples_dir) as entries:
+            self.scripts = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith('.task') and entry.is_file()
+            )
         
         if not self.scripts:
             print(f"No .task files found in '{self.examples_dir}'")
@@ -44,55 +56,115 @@ class ScriptSelector:
         print("\nAvailable scripts:\n")
         
         for i, script in enumerate(self.scripts, 1):
-            # Read first few lines for description
-            try:
-                with open(script, 'r', encoding='utf-8') as f:
-                    preview = f.read(100).replace('\n', ' ').strip()
-                    if len(preview) > 50:
-                        preview = preview[:50] + "..."
-            except:
-                preview = "N/A"
+            preview = self._get_preview(script)
             
             print(f"  {i}. {script.name}")
             print(f"     Preview: {preview}")
             print()
         
+        print(f"  {_ALL_CHOICE}. Compile all scripts")
         print(f"  {len(self.scripts) + 1}. Exit")
         print("="*60)
     
-    def select_script(self) -> Optional[Path]:
+    def _get_preview(self, script: Path) -> str:
+        """
+        Return the menu preview for a script.
+        
+        Previews are cached by modification time, so redrawing the menu
+        only re-reads scripts that changed since they were last shown.
+        
+        Args:
+            script: Path to the .task script file
+            
+        Returns:
+            Preview text, or "N/A" if the script cannot be read
+        """
+        try:
+            mtime = script.stat().st_mtime_ns
+        except OSError:
+            return "N/A"
+        
+        cached = self._previews.get(script)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        preview = self._read_preview(script)
+        self._previews[script] = (mtime, preview)
+        return preview
+    
+    @staticmethod
+    def _read_preview(script: Path) -> str:
+        """
+        Read the menu preview for a script from disk.
+        
+        The start of the file is fetched with one raw read. A multi-byte
+        character cut off at the end of the buffer is dropped; invalid
+        bytes elsewhere show up as U+FFFD.
+        
+        Args:
+            script: Path to the .task script file
+            
+        Returns:
+            First line(s) of the script joined with spaces, or "N/A"
+        """
+        try:
+            fd = os.open(script, os.O_RDONLY)
+            try:
+                data = os.read(fd, _PREVIEW_BYTES)
+            finally:
+                os.close(fd)
+        except OSError:
+            return "N/A"
+        
+        # Without final=True the decoder holds back a trailing partial sequence
+        text = codecs.getincrementaldecoder('utf-8')('replace').decode(data)
+        preview = " ".join(text.splitlines()).strip()
+        if len(preview) > 50:
+            preview = preview[:50] + "..."
+        return preview
+    
+    def select_script(self) -> Union[Path, str, None]:
         """
         Prompt user to select a script.
         
         Returns:
-            Selected script path or None if user chooses to exit
+            Selected script path, _ALL_CHOICE to compile every script,
+            or None if user chooses to exit
         """
         if not self.scripts:
             return None
         
+        exit_choice = len(self.scripts) + 1
+        
         while True:
             try:
-                choice = input(f"\nSelect a script (1-{len(self.scripts) + 1}): ").strip()
-                
-                if not choice:
-                    continue
-                
-                choice_num = int(choice)
-                
-                if choice_num == len(self.scripts) + 1:
-                    print("Exiting...")
-                    return None
-                
-                if 1 <= choice_num <= len(self.scripts):
-                    return self.scripts[choice_num - 1]
-                else:
-                    print(f"Invalid choice. Please enter a number between 1 and {len(self.scripts) + 1}")
-            
-            except ValueError:
-                print("Invalid input. Please enter a number.")
+                choice = input(f"\nSelect a script (1-{exit_choice}, or '{_ALL_CHOICE}' for all): ").strip()
             except KeyboardInterrupt:
                 print("\n\nExiting...")
                 return None
+            
+            if not choice:
+                continue
+            
+            if choice.lower() == _ALL_CHOICE:
+                return _ALL_CHOICE
+            
+            # isdecimal() is stricter than int(), which also takes '+1' or '1_0';
+            # every string it accepts parses, so int() below cannot raise
+            if not choice.isdecimal():
+                print(f"Invalid input. Please enter a number or '{_ALL_CHOICE}'.")
+                continue
+            
+            choice_num = int(choice)
+            
+            if choice_num == exit_choice:
+                print("Exiting...")
+                return None
+            
+            if 1 <= choice_num < exit_choice:
+                return self.scripts[choice_num - 1]
+            
+            print(f"Invalid choice. Please enter a number between 1 and {exit_choice}")
     
     def compile_script(self, script_path: Path, output_dir: str = "output"):
         """
@@ -102,26 +174,42 @@ class ScriptSelector:
             script_path: Path to the .task script file
             output_dir: Output directory for generated Python file
         """
+        # Deferred so showing the menu does not load the whole compiler
+        from .cli import compile_one
+        
         print(f"\nCompiling: {script_path.name}")
         print("-" * 60)
         
-        # Create a mock CLI instance and run compilation
-        # We'll simulate the CLI arguments
-        original_argv = sys.argv
-        try:
-            sys.argv = ['tasklang', str(script_path), '--output', output_dir]
-            cli = TaskLangCLI()
-            cli.run()
-        except SystemExit as e:
-            # CLI uses sys.exit(0) on success, sys.exit(1) on error
-            if e.code != 0:
-                print(f"\n❌ Compilation failed with exit code {e.code}")
-            else:
-                print(f"\n✅ Compilation successful!")
-        except Exception as e:
-            print(f"\n❌ Error during compilation: {e}")
-        finally:
-            sys.argv = original_argv
+        if compile_one(str(script_path), output_dir) == 0:
+            print(f"\n✅ Compilation successful!")
+        else:
+            print("\n❌ Compilation failed")
+    
+    def compile_all(self, output_dir: str = "output") -> List[int]:
+        """
+        Compile every available script, in parallel when there are several.
+        
+        Args:
+            output_dir: Output directory for generated Python files
+            
+        Returns:
+            Status for each script in self.scripts (0 on success, 1 on failure)
+        """
+        if not self.scripts:
+            return []
+        
+        from .cli import compile_many
+        
+        print(f"\nCompiling {len(self.scripts)} scripts")
+        print("-" * 60)
+        
+        statuses = compile_many([str(script) for script in self.scripts], output_dir)
+        failed = sum(1 for status in statuses if status)
+        if failed:
+            print(f"\n❌ {failed} of {len(statuses)} scripts failed to compile")
+        else:
+            print(f"\n✅ All {len(statuses)} scripts compiled successfully!")
+        return statuses
     
     def run(self):
         """Run the interactive script selector."""
@@ -132,7 +220,10 @@ class ScriptSelector:
             if selected_script is None:
                 break
             
-            self.compile_script(selected_script)
+            if selected_script == _ALL_CHOICE:
+                self.compile_all()
+            else:
+                self.compile_script(selected_script)
             
             # Ask if user wants to continue
             while True:
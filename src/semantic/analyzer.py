@@ -6,6 +6,25 @@ from ..parser.ast import (
 )
 
 
+# Statements whose only requirement is a loaded page (or an open browser,
+# which a loaded page implies)
+_PAGE_ACTIONS = frozenset([TypeNode, ClickNode, EnterNode, ScreenshotNode])
+
+# Error messages; templates with fields are filled in with str.format
+_NEED_BROWSER = "You must use 'open' command first."
+_NEED_PAGE = "You must use 'go' command to navigate to a URL first."
+_ERR_GO_NO_BROWSER = "Cannot navigate to URL '{url}' before opening a browser. " + _NEED_BROWSER
+_ERR_TYPE_NO_PAGE = "Cannot type text '{text}' before loading a page. " + _NEED_PAGE
+_ERR_CLICK_NO_PAGE = "Cannot click element before loading a page. " + _NEED_PAGE
+_ERR_ENTER_NO_PAGE = "Cannot press Enter before loading a page. " + _NEED_PAGE
+_ERR_WAIT_NOT_POSITIVE = (
+    "Wait time must be greater than 0, but got {seconds}. "
+    "Please specify a positive number of seconds."
+)
+_ERR_SCREENSHOT_NO_BROWSER = "Cannot take screenshot '{filename}' before opening a browser. " + _NEED_BROWSER
+_ERR_CLOSE_NO_BROWSER = "Cannot close browser before opening one. " + _NEED_BROWSER
+
+
 class SemanticError(Exception):
     """Exception raised when semantic analysis encounters an error."""
     
@@ -38,7 +57,19 @@ class SemanticAnalyzer:
         self.ast = ast
         self.browser_opened = False
         self.page_loaded = False
-        self.statement_index = 0
+        
+        # Statement type -> handler; node classes are never subclassed, so an
+        # exact type lookup matches what an isinstance chain would pick
+        self._dispatch = {
+            OpenNode: self._analyze_open,
+            GoNode: self._analyze_go,
+            TypeNode: self._analyze_type,
+            ClickNode: self._analyze_click,
+            EnterNode: self._analyze_enter,
+            WaitNode: self._analyze_wait,
+            ScreenshotNode: self._analyze_screenshot,
+            CloseNode: self._analyze_close,
+        }
     
     def analyze(self):
         """
@@ -52,40 +83,16 @@ class SemanticAnalyzer:
         """
         self.browser_opened = False
         self.page_loaded = False
-        self.statement_index = 0
-        
-        for statement in self.ast.statements:
-            self._analyze_statement(statement)
-            self.statement_index += 1
-    
-    def _analyze_statement(self, statement):
-        """
-        Analyze a single statement.
-        
-        Args:
-            statement: An AST node representing a statement
-            
-        Raises:
-            SemanticError: If semantic rules are violated
-        """
-        line_number = self.statement_index + 1
         
-        if isinstance(statement, OpenNode):
-            self._analyze_open(statement, line_number)
-        elif isinstance(statement, GoNode):
-            self._analyze_go(statement, line_number)
-        elif isinstance(statement, TypeNode):
-            self._analyze_type(statement, line_number)
-        elif isinstance(statement, ClickNode):
-            self._analyze_click(statement, line_number)
-        elif isinstance(statement, EnterNode):
-            self._analyze_enter(statement, line_number)
-        elif isinstance(statement, WaitNode):
-            self._analyze_wait(statement, line_number)
-        elif isinstance(statement, ScreenshotNode):
-            self._analyze_screenshot(statement, line_number)
-        elif isinstance(statement, CloseNode):
-            self._analyze_close(statement, line_number)
+        dispatch = self._dispatch
+        for line_number, statement in enumerate(self.ast.statements, 1):
+            statement_type = type(statement)
+            if self.page_loaded and statement_type in _PAGE_ACTIONS:
+                # A loaded page implies an open browser, so these checks all pass
+                continue
+            handler = dispatch.get(statement_type)
+            if handler is not None:
+                handler(statement, line_number)
     
     def _analyze_open(self, node: OpenNode, line_number: int):
         """Analyze an OpenNode statement."""
@@ -96,64 +103,36 @@ class SemanticAnalyzer:
     def _analyze_go(self, node: GoNode, line_number: int):
         """Analyze a GoNode statement."""
         if not self.browser_opened:
-            raise SemanticError(
-                f"Cannot navigate to URL '{node.url}' before opening a browser. "
-                "You must use 'open' command first.",
-                line_number
-            )
+            raise SemanticError(_ERR_GO_NO_BROWSER.format(url=node.url), line_number)
         self.page_loaded = True
     
     def _analyze_type(self, node: TypeNode, line_number: int):
         """Analyze a TypeNode statement."""
         if not self.page_loaded:
-            raise SemanticError(
-                f"Cannot type text '{node.text}' before loading a page. "
-                "You must use 'go' command to navigate to a URL first.",
-                line_number
-            )
+            raise SemanticError(_ERR_TYPE_NO_PAGE.format(text=node.text), line_number)
     
     def _analyze_click(self, node: ClickNode, line_number: int):
         """Analyze a ClickNode statement."""
         if not self.page_loaded:
-            raise SemanticError(
-                "Cannot click element before loading a page. "
-                "You must use 'go' command to navigate to a URL first.",
-                line_number
-            )
+            raise SemanticError(_ERR_CLICK_NO_PAGE, line_number)
     
     def _analyze_enter(self, node: EnterNode, line_number: int):
         """Analyze an EnterNode statement."""
         if not self.page_loaded:
-            raise SemanticError(
-                "Cannot press Enter before loading a page. "
-                "You must use 'go' command to navigate to a URL first.",
-                line_number
-            )
+            raise SemanticError(_ERR_ENTER_NO_PAGE, line_number)
     
     def _analyze_wait(self, node: WaitNode, line_number: int):
         """Analyze a WaitNode statement."""
         if node.seconds <= 0:
-            raise SemanticError(
-                f"Wait time must be greater than 0, but got {node.seconds}. "
-                "Please specify a positive number of seconds.",
-                line_number
-            )
+            raise SemanticError(_ERR_WAIT_NOT_POSITIVE.format(seconds=node.seconds), line_number)
     
     def _analyze_screenshot(self, node: ScreenshotNode, line_number: int):
         """Analyze a ScreenshotNode statement."""
         if not self.browser_opened:
-            raise SemanticError(
-                f"Cannot take screenshot '{node.filename}' before opening a browser. "
-                "You must use 'open' command first.",
-                line_number
-            )
+            raise SemanticError(_ERR_SCREENSHOT_NO_BROWSER.format(filename=node.filename), line_number)
     
     def _analyze_close(self, node: CloseNode, line_number: int):
         """Analyze a CloseNode statement."""
         if not self.browser_opened:
-            raise SemanticError(
-                "Cannot close browser before opening one. "
-                "You must use 'open' command first.",
-                line_number
-            )
+            raise SemanticError(_ERR_CLOSE_NO_BROWSER, line_number)
 
@@ -0,0 +1,71 @@
+"""Unit tests for the TaskLang Python code generator."""
+
+from ast import literal_eval
+
+import pytest
+from src.codegen.python_gen import PythonCodeGenerator, _py_str_literal
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
+from src.parser.ast import CloseNode
+
+
+def _parse(source):
+    """Build a fresh, unshared AST (tests here modify it)."""
+    return Parser(Lexer(source).tokenize()).parse()
+
+
+def test_multi_selector_click_compiles(tmp_path):
+    """Test that a comma-separated CSS click emits a valid flat selector loop."""
+    source = 'open chrome\ngo https://a.com\nclick css "#submit, .btn-primary, button"'
+    code = PythonCodeGenerator(_parse(source)).generate(str(tmp_path / "click.py"))
+    
+    assert "selectors_list = ['#submit', '.btn-primary', 'button']" in code
+    assert "for _sel in selectors_list:" in code
+    compile(code, "click.py", "exec")
+
+
+def test_single_selector_click_with_quotes_compiles(tmp_path):
+    """Test that a click warning quoting a selector with quotes is valid Python."""
+    source = 'open chrome\ngo https://a.com\nclick xpath "//a[@title=\'it\'s\']"'
+    code = PythonCodeGenerator(_parse(source)).generate(str(tmp_path / "click.py"))
+    
+    compile(code, "click.py", "exec")
+
+
+@pytest.mark.parametrize("value", [
+    "plain",
+    'say "hi"',
+    "back\\slash",
+    'trailing backslash\\',
+    "line1\nline2",
+    "cr\rlf",
+    '\\"',
+    "",
+])
+def test_py_str_literal_round_trips(value):
+    """Test that _py_str_literal produces a literal evaluating back to its input."""
+    literal = _py_str_literal(value)
+    
+    assert literal.startswith('"') and literal.endswith('"')
+    assert "\n" not in literal and "\r" not in literal
+    assert literal_eval(literal) == value
+
+
+def test_regenerate_after_in_place_ast_edit(tmp_path):
+    """Test that edits made to an AST after a first generate() reach the output."""
+    ast = _parse("open chrome\ngo https://a.com")
+    output_file = str(tmp_path / "script.py")
+    
+    first = PythonCodeGenerator(ast).generate(output_file)
+    assert 'driver.get("https://a.com")' in first
+    assert "driver.quit()" not in first
+    
+    # Format the memoized reprs before editing, as the GUI's AST panel would
+    repr(ast)
+    ast.statements.append(CloseNode())
+    ast.statements[1].url = 'https://b.com'
+    
+    second = PythonCodeGenerator(ast).generate(output_file)
+    assert 'driver.get("https://b.com")' in second
+    assert "a.com" not in second
+    assert second.endswith("driver.quit()\n")
@@ -0,0 +1,63 @@
+"""Shared fixtures for the TaskLang test suite."""
+
+import functools
+
+import pytest
+from src.lexer.lexer import Lexer
+from src.parser.parser import Parser
+
+
+@functools.lru_cache(maxsize=None)
+def _tokens_for(source: str):
+    """Tokenize source once per test session."""
+    return Lexer(source).tokenize()
+
+
+@functools.lru_cache(maxsize=None)
+def _ast_for(source: str):
+    """Parse source once per test session."""
+    return Parser(_tokens_for(source)).parse()
+
+
+@pytest.fixture(scope="session")
+def tokens_for():
+    """
+    Return a cached tokenizer for test sources.
+    
+    The returned lists are shared between tests and must not be modified.
+    Sources that fail to lex raise on every call, since errors are not cached.
+    """
+    return _tokens_for
+
+
+@pytest.fixture(scope="session")
+def ast_for():
+    """
+    Return a cached parser for test sources.
+    
+    The returned ProgramNodes are shared between tests and must not be modified.
+    """
+    return _ast_for
+
+
+@pytest.fixture(scope="session")
+def golden_source():
+    """Return the example program shared by the lexer, parser and semantic tests."""
+    return """open chrome
+go https://google.com
+type "compiler project"
+enter
+wait 2
+screenshot test.png"""
+
+
+@pytest.fixture(scope="session")
+def golden_tokens(golden_source):
+    """Return the tokens of the example program."""
+    return _tokens_for(golden_source)
+
+
+@pytest.fixture(scope="session")
+def golden_ast(golden_source):
+    """Return the parsed example program."""
+    return _ast_for(golden_source)
@@ -2,217 +2,201 @@
 
 import pytest
 from src.lexer.lexer import Lexer, LexerError
-from src.lexer.token import Token
 
 
-class TestLexer:
-    """Test cases for the Lexer class."""
-    
-    def test_single_command_open_chrome(self):
-        """Test tokenization of 'open chrome' command."""
-        source = "open chrome"
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        assert len(tokens) == 2
-        assert tokens[0] == Token('OPEN', 'open', 1, 1)
-        assert tokens[1] == Token('IDENTIFIER', 'chrome', 1, 6)
-    
-    def test_full_example_program(self):
-        """Test tokenization of the full example program."""
-        source = """open chrome
-go https://google.com
-type "compiler project"
-enter
-wait 2
-screenshot test.png"""
-        
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        # Verify token count and types
-        expected_tokens = [
-            ('OPEN', 'open', 1, 1),
-            ('IDENTIFIER', 'chrome', 1, 6),
-            ('GO', 'go', 2, 1),
-            ('URL', 'https://google.com', 2, 4),
-            ('TYPE', 'type', 3, 1),
-            ('STRING', 'compiler project', 3, 6),
-            ('ENTER', 'enter', 4, 1),
-            ('WAIT', 'wait', 5, 1),
-            ('NUMBER', '2', 5, 6),
-            ('SCREENSHOT', 'screenshot', 6, 1),
-            ('IDENTIFIER', 'test.png', 6, 12),
-        ]
-        
-        assert len(tokens) == len(expected_tokens)
-        for i, (token_type, value, line, column) in enumerate(expected_tokens):
-            assert tokens[i].type == token_type
-            assert tokens[i].value == value
-            assert tokens[i].line == line
-            assert tokens[i].column == column
-    
-    def test_comments_are_ignored(self):
-        """Test that comments (lines starting with #) are ignored."""
-        source = """open chrome
+ALL_KEYWORDS = ('open', 'go', 'type', 'click', 'enter', 'wait', 'screenshot', 'close')
+
+# (type, value, line, column) of every token in the golden example program
+EXPECTED_GOLDEN_TOKENS = (
+    ('OPEN', 'open', 1, 1),
+    ('IDENTIFIER', 'chrome', 1, 6),
+    ('GO', 'go', 2, 1),
+    ('URL', 'https://google.com', 2, 4),
+    ('TYPE', 'type', 3, 1),
+    ('STRING', 'compiler project', 3, 6),
+    ('ENTER', 'enter', 4, 1),
+    ('WAIT', 'wait', 5, 1),
+    ('NUMBER', '2', 5, 6),
+    ('SCREENSHOT', 'screenshot', 6, 1),
+    ('IDENTIFIER', 'test.png', 6, 12),
+)
+
+
+def _err_tuple(exc):
+    """Return (error class name, line, column) for one-shot position checks."""
+    return (type(exc).__name__, exc.line, getattr(exc, 'column', None))
+
+
+def test_single_command_open_chrome(tokens_for):
+    """Test tokenization of 'open chrome' command."""
+    source = "open chrome"
+    tokens = tokens_for(source)
+    
+    assert [(t.type, t.value, t.line, t.column) for t in tokens] == [
+        ('OPEN', 'open', 1, 1),
+        ('IDENTIFIER', 'chrome', 1, 6),
+    ]
+
+
+def test_full_example_program(golden_tokens):
+    """Test tokenization of the full example program."""
+    # Verify token count and types
+    actual_tokens = tuple((t.type, t.value, t.line, t.column) for t in golden_tokens)
+    assert actual_tokens == EXPECTED_GOLDEN_TOKENS
+
+
+def test_comments_are_ignored(tokens_for):
+    """Test that comments (lines starting with #) are ignored."""
+    source = """open chrome
 # This is a comment
 go https://google.com
 # Another comment
 type "hello"
 """
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        # Should not have any COMMENT tokens, and comments should be skipped
-        token_types = [token.type for token in tokens]
-        assert 'COMMENT' not in token_types
-        
-        # Verify actual tokens
-        assert tokens[0].type == 'OPEN'
-        assert tokens[1].type == 'IDENTIFIER'
-        assert tokens[2].type == 'GO'
-        assert tokens[3].type == 'URL'
-        assert tokens[4].type == 'TYPE'
-        assert tokens[5].type == 'STRING'
-    
-    def test_whitespace_is_skipped(self):
-        """Test that whitespace and tabs are skipped."""
-        source = "open    chrome\t\t\nwait  2"
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        # Should only have tokens, no whitespace tokens
-        assert len(tokens) == 4
-        assert tokens[0].type == 'OPEN'
-        assert tokens[1].type == 'IDENTIFIER'
-        assert tokens[2].type == 'WAIT'
-        assert tokens[3].type == 'NUMBER'
-    
-    def test_string_literal(self):
-        """Test string literal tokenization."""
-        source = 'type "hello world"'
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        assert len(tokens) == 2
-        assert tokens[0].type == 'TYPE'
-        assert tokens[1].type == 'STRING'
-        assert tokens[1].value == 'hello world'
-    
-    def test_number_token(self):
-        """Test number tokenization."""
-        source = "wait 123"
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        assert len(tokens) == 2
-        assert tokens[0].type == 'WAIT'
-        assert tokens[1].type == 'NUMBER'
-        assert tokens[1].value == '123'
-    
-    def test_url_token(self):
-        """Test URL tokenization."""
-        source = "go http://example.com"
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        assert len(tokens) == 2
-        assert tokens[0].type == 'GO'
-        assert tokens[1].type == 'URL'
-        assert tokens[1].value == 'http://example.com'
-        
-        source2 = "go https://test.org/path"
-        lexer2 = Lexer(source2)
-        tokens2 = lexer2.tokenize()
-        
-        assert tokens2[1].type == 'URL'
-        assert tokens2[1].value == 'https://test.org/path'
-    
-    def test_all_keywords(self):
-        """Test that all keywords are recognized."""
-        keywords = ['open', 'go', 'type', 'click', 'enter', 'wait', 'screenshot', 'close']
-        
-        for keyword in keywords:
-            source = keyword
-            lexer = Lexer(source)
-            tokens = lexer.tokenize()
-            
-            assert len(tokens) == 1
-            assert tokens[0].type == keyword.upper()
-            assert tokens[0].value == keyword
-    
-    def test_keywords_case_insensitive(self):
-        """Test that keywords are case-insensitive."""
-        source = "OPEN Chrome"
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        assert tokens[0].type == 'OPEN'
-        assert tokens[0].value == 'OPEN'
-    
-    def test_identifier_with_dots(self):
-        """Test identifiers with dots (like filenames)."""
-        source = "screenshot test.png"
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        assert tokens[1].type == 'IDENTIFIER'
-        assert tokens[1].value == 'test.png'
-    
-    def test_unterminated_string_raises_error(self):
-        """Test that unterminated string raises LexerError."""
-        source = 'type "unterminated string'
-        lexer = Lexer(source)
-        
-        with pytest.raises(LexerError) as exc_info:
-            lexer.tokenize()
-        
-        assert "Unterminated string literal" in str(exc_info.value)
-        assert exc_info.value.line == 1
-        assert exc_info.value.column == 6
-    
-    def test_invalid_symbol_raises_error(self):
-        """Test that invalid symbols raise LexerError."""
-        source = "open chrome @invalid"
-        lexer = Lexer(source)
-        
-        with pytest.raises(LexerError) as exc_info:
-            lexer.tokenize()
-        
-        assert "Unexpected character" in str(exc_info.value)
-        assert '@' in str(exc_info.value)
-    
-    def test_empty_source(self):
-        """Test tokenization of empty source."""
-        source = ""
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        assert len(tokens) == 0
-    
-    def test_only_whitespace(self):
-        """Test tokenization of source with only whitespace."""
-        source = "   \n\t  \n  "
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        assert len(tokens) == 0
-    
-    def test_only_comments(self):
-        """Test tokenization of source with only comments."""
-        source = "# This is a comment\n# Another comment"
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        assert len(tokens) == 0
-    
-    def test_multiline_string_error(self):
-        """Test that strings spanning multiple lines raise error."""
-        source = 'type "line1\nline2"'
-        lexer = Lexer(source)
-        
-        with pytest.raises(LexerError) as exc_info:
-            lexer.tokenize()
-        
-        assert "Unterminated string literal" in str(exc_info.value)
+    tokens = tokens_for(source)
+    
+    # Should not have any COMMENT tokens, and comments should be skipped
+    token_types = [token.type for token in tokens]
+    assert 'COMMENT' not in token_types
+    
+    # Verify actual tokens
+    assert tokens[0].type == 'OPEN'
+    assert tokens[1].type == 'IDENTIFIER'
+    assert tokens[2].type == 'GO'
+    assert tokens[3].type == 'URL'
+    assert tokens[4].type == 'TYPE'
+    assert tokens[5].type == 'STRING'
+
+
+def test_whitespace_is_skipped(tokens_for):
+    """Test that whitespace and tabs are skipped."""
+    source = "open    chrome\t\t\nwait  2"
+    tokens = tokens_for(source)
+    
+    # Should only have tokens, no whitespace tokens
+    assert len(tokens) == 4
+    assert tokens[0].type == 'OPEN'
+    assert tokens[1].type == 'IDENTIFIER'
+    assert tokens[2].type == 'WAIT'
+    assert tokens[3].type == 'NUMBER'
+
+
+def test_string_literal(tokens_for):
+    """Test string literal tokenization."""
+    source = 'type "hello world"'
+    tokens = tokens_for(source)
+    
+    assert len(tokens) == 2
+    assert tokens[0].type == 'TYPE'
+    assert tokens[1].type == 'STRING'
+    assert tokens[1].value == 'hello world'
+
+
+def test_number_token(tokens_for):
+    """Test number tokenization."""
+    source = "wait 123"
+    tokens = tokens_for(source)
+    
+    assert len(tokens) == 2
+    assert tokens[0].type == 'WAIT'
+    assert tokens[1].type == 'NUMBER'
+    assert tokens[1].value == '123'
+
+
+def test_url_token(tokens_for):
+    """Test URL tokenization."""
+    source = "go http://example.com"
+    tokens = tokens_for(source)
+    
+    assert len(tokens) == 2
+    assert tokens[0].type == 'GO'
+    assert tokens[1].type == 'URL'
+    assert tokens[1].value == 'http://example.com'
+    
+    source2 = "go https://test.org/path"
+    tokens2 = tokens_for(source2)
+    
+    assert tokens2[1].type == 'URL'
+    assert tokens2[1].value == 'https://test.org/path'
+
+
+@pytest.mark.parametrize("keyword", ALL_KEYWORDS)
+def test_all_keywords(tokens_for, keyword):
+    """Test that all keywords are recognized."""
+    tokens = tokens_for(keyword)
+    
+    assert len(tokens) == 1
+    assert tokens[0].type == keyword.upper()
+    assert tokens[0].value == keyword
+
+
+def test_keywords_case_insensitive(tokens_for):
+    """Test that keywords are case-insensitive."""
+    source = "OPEN Chrome"
+    tokens = tokens_for(source)
+    
+    assert tokens[0].type == 'OPEN'
+    assert tokens[0].value == 'OPEN'
+
+
+def test_identifier_with_dots(tokens_for):
+    """Test identifiers with dots (like filenames)."""
+    source = "screenshot test.png"
+    tokens = tokens_for(source)
+    
+    assert tokens[1].type == 'IDENTIFIER'
+    assert tokens[1].value == 'test.png'
+
+
+def test_unterminated_string_raises_error():
+    """Test that unterminated string raises LexerError."""
+    source = 'type "unterminated string'
+    lexer = Lexer(source)
+    
+    with pytest.raises(LexerError, match="Unterminated string literal") as exc_info:
+        lexer.tokenize()
+    
+    assert _err_tuple(exc_info.value) == ('LexerError', 1, 6)
+
+
+def test_invalid_symbol_raises_error():
+    """Test that invalid symbols raise LexerError."""
+    source = "open chrome @invalid"
+    lexer = Lexer(source)
+    
+    with pytest.raises(LexerError, match="Unexpected character.*@"):
+        lexer.tokenize()
+
+
+def test_empty_source(tokens_for):
+    """Test tokenization of empty source."""
+    source = ""
+    tokens = tokens_for(source)
+    
+    assert len(tokens) == 0
+
+
+def test_only_whitespace(tokens_for):
+    """Test tokenization of source with only whitespace."""
+    source = "   \n\t  \n  "
+    tokens = tokens_for(source)
+    
+    assert len(tokens) == 0
+
+
+def test_only_comments(tokens_for):
+    """Test tokenization of source with only comments."""
+    source = "# This is a comment\n# Another comment"
+    tokens = tokens_for(source)
+    
+    assert len(tokens) == 0
+
+
+def test_multiline_string_error():
+    """Test that strings spanning multiple lines raise error."""
+    source = 'type "line1\nline2"'
+    lexer = Lexer(source)
+    
+    with pytest.raises(LexerError, match="Unterminated string literal"):
+        lexer.tokenize()
 
@@ -0,0 +1,38 @@
+"""Unit tests for the on-disk front-end cache."""
+
+import os
+
+import pytest
+from src import cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Point the cache at a per-test directory holding at most three entries."""
+    monkeypatch.setattr(cache, "cache_dir", tmp_path)
+    monkeypatch.setattr(cache, "MAX_ENTRIES", 3)
+    return tmp_path
+
+
+def _age(source, seconds):
+    """Set a cached entry's last-use time to ``seconds`` after the epoch."""
+    path = cache.cache_dir / f"{cache.cache_key(source)}.pkl"
+    os.utime(path, (seconds, seconds))
+
+
+def test_store_prunes_least_recently_used(ast_for, tokens_for):
+    """Test that storing beyond MAX_ENTRIES deletes the oldest entries."""
+    sources = ["open chrome", "open firefox", "open edge", "open safari"]
+    for age, source in enumerate(sources[:3], 1):
+        cache.store(source, tokens_for(source), ast_for(source))
+        _age(source, age)
+    
+    # A hit refreshes the oldest entry, so the second-oldest goes instead
+    assert cache.load(sources[0]) is not None
+    cache.store(sources[3], tokens_for(sources[3]), ast_for(sources[3]))
+    
+    assert len(list(cache.cache_dir.glob("*.pkl"))) == 3
+    assert cache.load(sources[1]) is None
+    for source in (sources[0], sources[2], sources[3]):
+        tokens, ast = cache.load(source)
+        assert repr(ast) == repr(ast_for(source))
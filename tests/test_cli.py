@@ -0,0 +1,131 @@
+"""Unit tests for the TaskLang command-line compiler."""
+
+import sys
+
+import pytest
+from src import cache
+from src.cli import TaskLangCLI, compile_one, compile_many
+
+
+VALID_SOURCE = "open chrome\ngo https://google.com\nclose\n"
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Point the on-disk caches at a per-test directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(cache, "cache_dir", cache_dir)
+    return cache_dir
+
+
+def _write_task(directory, name, source):
+    """Write a .task file and return its path as a string."""
+    path = directory / name
+    path.write_text(source, encoding='utf-8')
+    return str(path)
+
+
+def _run_cli(monkeypatch, *argv):
+    """Run the CLI with the given arguments, as if invoked from the shell."""
+    monkeypatch.setattr(sys, "argv", ["tasklang", *argv])
+    TaskLangCLI().run()
+
+
+def test_unchanged_source_hits_output_cache(tmp_path, capsys, isolated_cache):
+    """Test that recompiling an unchanged file reuses the cached output."""
+    path = _write_task(tmp_path, "demo.task", VALID_SOURCE)
+    out_dir = tmp_path / "out"
+    
+    assert compile_one(path, str(out_dir)) == 0
+    assert "(cached)" not in capsys.readouterr().out
+    generated = (out_dir / "demo.py").read_text(encoding='utf-8')
+    
+    (out_dir / "demo.py").unlink()
+    assert compile_one(path, str(out_dir)) == 0
+    assert "(cached)" in capsys.readouterr().out
+    assert (out_dir / "demo.py").read_text(encoding='utf-8') == generated
+    
+    # Cached scripts are kept out of the output directory
+    assert [p.name for p in out_dir.iterdir()] == ["demo.py"]
+    assert len(list((isolated_cache / "cli").glob("demo.*.py"))) == 1
+
+
+def test_modified_source_misses_output_cache(tmp_path, capsys, isolated_cache):
+    """Test that editing a file recompiles it and replaces its cache entry."""
+    path = _write_task(tmp_path, "demo.task", VALID_SOURCE)
+    out_dir = tmp_path / "out"
+    assert compile_one(path, str(out_dir)) == 0
+    capsys.readouterr()
+    
+    _write_task(tmp_path, "demo.task", VALID_SOURCE.replace("google.com", "example.com"))
+    assert compile_one(path, str(out_dir)) == 0
+    
+    assert "(cached)" not in capsys.readouterr().out
+    assert 'driver.get("https://example.com")' in (out_dir / "demo.py").read_text(encoding='utf-8')
+    assert len(list((isolated_cache / "cli").glob("demo.*.py"))) == 1
+
+
+def test_verbose_bypasses_output_cache(tmp_path, capsys):
+    """Test that -v prints every stage even when a cached output exists."""
+    path = _write_task(tmp_path, "demo.task", VALID_SOURCE)
+    out_dir = str(tmp_path / "out")
+    assert compile_one(path, out_dir) == 0
+    capsys.readouterr()
+    
+    assert compile_one(path, out_dir, verbose=True) == 0
+    
+    out = capsys.readouterr().out
+    assert "(cached)" not in out
+    assert "Tokens:" in out
+    assert "AST:" in out
+    assert "✅ Semantic Analysis Passed" in out
+
+
+def test_several_files_compile_in_parallel(tmp_path, monkeypatch):
+    """Test that every file is compiled and any failure sets the exit status."""
+    good = _write_task(tmp_path, "good.task", VALID_SOURCE)
+    bad = _write_task(tmp_path, "bad.task", "go https://google.com\n")
+    other = _write_task(tmp_path, "other.task", "open firefox\nclose\n")
+    out_dir = tmp_path / "out"
+    
+    with pytest.raises(SystemExit) as exc_info:
+        _run_cli(monkeypatch, good, bad, other, "-o", str(out_dir))
+    
+    assert exc_info.value.code == 1
+    assert (out_dir / "good.py").exists()
+    assert (out_dir / "other.py").exists()
+    assert not (out_dir / "bad.py").exists()
+
+
+def test_bare_cr_line_endings_report_correct_line(tmp_path, capsys):
+    """Test that old Mac line endings are translated before lexing, whatever the file size."""
+    padding = "# " + "x" * 100 + "\r"
+    path = tmp_path / "mac.task"
+    path.write_bytes((padding * 1000 + "open chrome\r@\r").encode('utf-8'))
+    
+    assert compile_one(str(path), str(tmp_path / "out")) == 1
+    assert "at line 1002, column 1" in capsys.readouterr().err
+
+
+def test_compile_many_reports_status_per_file(tmp_path):
+    """Test that compile_many returns each file's exit status in input order."""
+    paths = [
+        _write_task(tmp_path, "good.task", VALID_SOURCE),
+        _write_task(tmp_path, "semantic.task", "go https://google.com\n"),
+        _write_task(tmp_path, "syntax.task", "wait\n"),
+        _write_task(tmp_path, "wrong.txt", VALID_SOURCE),
+        str(tmp_path / "missing.task"),
+        _write_task(tmp_path, "other.task", "open firefox\nclose\n"),
+    ]
+    out_dir = tmp_path / "out"
+    
+    assert compile_many(paths, str(out_dir)) == [0, 1, 1, 1, 1, 0]
+    assert sorted(p.name for p in out_dir.iterdir()) == ["good.py", "other.py"]
+
+
+@pytest.mark.parametrize("source,expected", [(VALID_SOURCE, [0]), ("close\n", [1])])
+def test_compile_many_single_file(tmp_path, source, expected):
+    """Test that a single file is compiled in-process with the same status."""
+    path = _write_task(tmp_path, "one.task", source)
+    
+    assert compile_many([path], str(tmp_path / "out")) == expected
@@ -0,0 +1,28 @@
+"""Unit tests for the TaskLang GUI compile pipeline."""
+
+import pytest
+from src import cache
+
+pytest.importorskip("tkinter")
+from src.gui.main_window import MainWindow
+
+
+@pytest.fixture
+def window(tmp_path, monkeypatch):
+    """Return a MainWindow without any widgets, for driving the compile worker."""
+    monkeypatch.setattr(cache, "cache_dir", tmp_path / "cache")
+    window = MainWindow.__new__(MainWindow)
+    window._codegen_cache = {}
+    return window
+
+
+def test_bare_cr_line_endings_report_correct_line(tmp_path, window):
+    """Test that the GUI reports the same error position as the CLI for old Mac line endings."""
+    path = tmp_path / "mac.task"
+    path.write_bytes(b"open chrome\rgo https://a.com\r@\r")
+    
+    source = window._read_source(path)
+    result = window._compile_worker(source, path, tmp_path / "out")
+    
+    assert result.error.startswith("Lexer Error:")
+    assert "at line 3, column 1" in result.error
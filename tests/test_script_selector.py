@@ -0,0 +1,54 @@
+"""Unit tests for the interactive TaskLang script selector."""
+
+import pytest
+from src import cache
+from src.script_selector import ScriptSelector
+
+
+@pytest.fixture
+def examples(tmp_path, monkeypatch):
+    """Return an examples directory with one valid and one invalid script."""
+    monkeypatch.setattr(cache, "cache_dir", tmp_path / "cache")
+    monkeypatch.chdir(tmp_path)
+    examples_dir = tmp_path / "examples"
+    examples_dir.mkdir()
+    (examples_dir / "good.task").write_text("open chrome\ngo https://google.com\nclose\n", encoding='utf-8')
+    (examples_dir / "bad.task").write_text("go https://google.com\n", encoding='utf-8')
+    return examples_dir
+
+
+def _answer(monkeypatch, *answers):
+    """Feed the given answers to successive input() prompts."""
+    replies = iter(answers)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(replies))
+
+
+def test_menu_lists_compile_all_choice(examples, capsys):
+    """Test that the menu offers compiling every script before the exit choice."""
+    ScriptSelector(str(examples)).display_menu()
+    
+    out = capsys.readouterr().out
+    assert "  a. Compile all scripts" in out
+    assert out.index("Compile all scripts") < out.index("3. Exit")
+
+
+def test_compile_all_choice_compiles_every_script(examples, monkeypatch, capsys):
+    """Test that choosing 'a' compiles every listed script in one batch."""
+    _answer(monkeypatch, "A", "n")
+    
+    ScriptSelector(str(examples)).run()
+    
+    assert "1 of 2 scripts failed to compile" in capsys.readouterr().out
+    assert sorted(p.name for p in (examples.parent / "output").iterdir()) == ["good.py"]
+
+
+@pytest.mark.parametrize("data,expected", [
+    ("€" * 40, "€" * 33),
+    (b"open \xff chrome", "open � chrome"),
+])
+def test_preview_decoding(tmp_path, data, expected):
+    """Test that only a character cut off by the read limit is dropped from a preview."""
+    script = tmp_path / "preview.task"
+    script.write_bytes(data if isinstance(data, bytes) else data.encode('utf-8'))
+    
+    assert ScriptSelector._read_preview(script) == expected